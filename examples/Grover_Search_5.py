@@ -15,7 +15,7 @@ l0 = qvantum.Layer([qvantum.Hadamard(), qvantum.Hadamard(), qvantum.Hadamard(),
 l1 = qvantum.Layer([qvantum.Gate(), qvantum.PauliX(), qvantum.Gate(), qvantum.Gate()])
 
 g2 = qvantum.Gate()
-g2.set_matrix(numpy.matrix([
+g2.set_matrix(numpy.array([
 	[1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
 	[0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
 	[0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
@@ -40,7 +40,7 @@ l4 = qvantum.Layer([qvantum.Hadamard(), qvantum.Hadamard(), qvantum.Hadamard(),
 l5 = qvantum.Layer([qvantum.PauliX(), qvantum.PauliX(), qvantum.PauliX(), qvantum.Gate()])
 
 g6 = qvantum.Gate()
-g6.set_matrix(numpy.matrix([
+g6.set_matrix(numpy.array([
 	[1, 0, 0, 0, 0, 0, 0, 0],
 	[0, 1, 0, 0, 0, 0, 0, 0],
 	[0, 0, 1, 0, 0, 0, 0, 0],
@@ -1,4 +1,4 @@
-__all__ = ['Qubit', 'Random_Qubit', 'Register', 'Gate', 'Hadamard', 'SquareNot', 'PauliX', 'PauliY', 'PauliZ', 'Phase', 'Pi8', 'Swap', 'SquareSwap', 'CNOT', 'ControlledZ', 'ControlledPhase', 'Ising', 'Toffoli', 'Fredkin', 'Layer', 'Circuit', 'bloch_coords', 'bloch_qubit', 'bloch_sphere_plot', 'phase_test']
+__all__ = ['Qubit', 'Random_Qubit', 'Register', 'Gate', 'Hadamard', 'SquareNot', 'PauliX', 'PauliY', 'PauliZ', 'Phase', 'Pi8', 'Swap', 'SquareSwap', 'CNOT', 'ControlledZ', 'ControlledPhase', 'Ising', 'Toffoli', 'Fredkin', 'disable_checks', 'set_precision', 'Layer', 'Circuit', 'bloch_coords', 'bloch_qubit', 'bloch_sphere_plot', 'phase_test']
 from .qubit import Qubit
 from .qubit import Random_Qubit
 from .register import Register
@@ -18,9 +18,32 @@ from .gate import ControlledPhase
 from .gate import Ising
 from .gate import Toffoli
 from .gate import Fredkin
+from .gate import disable_checks
+from .precision import set_precision
 from .layer import Layer
 from .circuit import Circuit
-from .bloch import bloch_coords
-from .bloch import bloch_qubit
-from .bloch import bloch_sphere_plot
-from .bloch import phase_test
\ No newline at end of file
+import importlib
+
+# the bloch module imports matplotlib, so it's loaded only when it or one of its functions is used
+_LAZY_MODULES = ('bloch',)
+
+_LAZY_ATTRIBUTES = {
+    'bloch_coords': 'bloch',
+    'bloch_qubit': 'bloch',
+    'bloch_sphere_plot': 'bloch',
+    'phase_test': 'bloch'
+    }
+
+def __getattr__(name):
+    if name in _LAZY_MODULES:
+        return importlib.import_module('.' + name, __name__)
+
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(importlib.import_module('.' + _LAZY_ATTRIBUTES[name], __name__), name)
+        globals()[name] = value
+        return value
+
+    raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+
+def __dir__():
+    return sorted(set(__all__) | set(_LAZY_MODULES) | set(globals()))
@@ -0,0 +1,55 @@
+# cython: language_level=3
+'''compiled checking functions for layer class'''
+
+cdef tuple _gate_types = ()
+
+cdef object _is_gate = None
+
+def _configure(tuple gate_types, object is_gate):
+    """Function to set the built-in gate classes and the fallback check of other objects. It's 
+    called by check_layer when the module is imported, so the compiled and the pure python 
+    checks use the same gate classes and the same window of validated gates.
+    
+    Arguments:
+        gate_types {tuple} -- The built-in gate classes
+        is_gate {function} -- Check of objects which aren't instances of the built-in classes
+    """
+
+    global _gate_types, _is_gate
+    _gate_types = gate_types
+    _is_gate = is_gate
+
+cpdef bint _validate_gate(object g):
+    """Function to decide whether an object is an instance of the Gate class or one of its 
+    subclasses. The built-in gate classes are compared by identity, other objects are checked 
+    by the fallback set by _configure().
+    
+    Arguments:
+        g {} -- The tested object
+    """
+
+    cdef object cls = type(g)
+    cdef object elem
+    for elem in _gate_types:
+
+        if cls is elem:
+            return True
+
+    return _is_gate(g)
+
+cpdef bint _validate_gate_list(object gate_list):
+    """Function to decide whether all elements of a list are instances of the Gate class or 
+    its subclasses. The argument isn't typed as list, so subclasses of list are accepted just 
+    like by the pure python check, Cython still iterates over exact lists directly.
+    
+    Arguments:
+        gate_list {list} -- The tested list
+    """
+
+    cdef object g
+    for g in gate_list:
+
+        if not _validate_gate(g):
+            return False
+
+    return True
@@ -0,0 +1,110 @@
+'''compiled kernels for gate class'''
+
+# pylint: disable=E1101, W1401
+
+import numpy
+
+try:
+    import numba
+
+except ImportError:
+    numba = None
+
+NUMBA_AVAILABLE = numba is not None
+
+if NUMBA_AVAILABLE:
+    _jit = numba.njit(cache=True, parallel=True, fastmath=True)
+    _prange = numba.prange
+
+else:
+    def _jit(function):
+        return function
+
+    _prange = range
+
+@_jit
+def _apply_1q(psi, m, k, n):
+    """Function to apply a 2x2 matrix on the k-th qubit of an n qubit state vector in place.
+    The 0th qubit is the most significant bit of the index of the amplitudes.
+
+    Arguments:
+        psi {numpy.ndarray} -- Contiguous complex state vector of 2^n amplitudes
+        m {numpy.ndarray} -- Contiguous complex 2x2 matrix
+        k {int} -- Index of the target qubit
+        n {int} -- Number of qubits
+    """
+
+    shift = n - 1 - k
+    bit = 1 << shift
+    low = bit - 1
+    m00, m01, m10, m11 = m[0, 0], m[0, 1], m[1, 0], m[1, 1]
+    for i in _prange(1 << (n - 1)):
+
+        i0 = ((i >> shift) << (shift + 1)) | (i & low)
+        i1 = i0 | bit
+        a = psi[i0]
+        b = psi[i1]
+        psi[i0] = m00 * a + m01 * b
+        psi[i1] = m10 * a + m11 * b
+
+    return psi
+
+@_jit
+def _apply_2q(psi, m, k0, k1, n):
+    """Function to apply a 4x4 matrix on the k0-th and k1-th qubits of an n qubit state vector
+    in place. The k0-th qubit is the more significant one in the basis of the matrix.
+
+    Arguments:
+        psi {numpy.ndarray} -- Contiguous complex state vector of 2^n amplitudes
+        m {numpy.ndarray} -- Contiguous complex 4x4 matrix
+        k0 {int} -- Index of the first target qubit
+        k1 {int} -- Index of the second target qubit
+        n {int} -- Number of qubits
+    """
+
+    s0 = n - 1 - k0
+    s1 = n - 1 - k1
+    bit0 = 1 << s0
+    bit1 = 1 << s1
+    lo = min(s0, s1)
+    hi = max(s0, s1)
+    lo_mask = (1 << lo) - 1
+    hi_mask = (1 << hi) - 1
+    for i in _prange(1 << (n - 2)):
+
+        base = ((i >> lo) << (lo + 1)) | (i & lo_mask)
+        base = ((base >> hi) << (hi + 1)) | (base & hi_mask)
+        i0 = base
+        i1 = base | bit1
+        i2 = base | bit0
+        i3 = base | bit0 | bit1
+        a0 = psi[i0]
+        a1 = psi[i1]
+        a2 = psi[i2]
+        a3 = psi[i3]
+        psi[i0] = m[0, 0] * a0 + m[0, 1] * a1 + m[0, 2] * a2 + m[0, 3] * a3
+        psi[i1] = m[1, 0] * a0 + m[1, 1] * a1 + m[1, 2] * a2 + m[1, 3] * a3
+        psi[i2] = m[2, 0] * a0 + m[2, 1] * a1 + m[2, 2] * a2 + m[2, 3] * a3
+        psi[i3] = m[3, 0] * a0 + m[3, 1] * a1 + m[3, 2] * a2 + m[3, 3] * a3
+
+    return psi
+
+def apply(matrix, vector, target_qubits, qubit_number):
+    """Function to apply the matrix of a one or two qubit gate on the given qubits of a register
+    state vector with the compiled kernels.
+
+    Arguments:
+        matrix {numpy.ndarray} -- Matrix of the gate
+        vector {numpy.ndarray} -- Flat state vector of the register
+        target_qubits {list} -- Indices of the qubits which the gate acts on
+        qubit_number {int} -- Number of qubits in the register
+    """
+
+    dtype = numpy.result_type(matrix, vector)
+    psi = numpy.array(vector, dtype=dtype)
+    m = numpy.ascontiguousarray(matrix, dtype=dtype)
+    if len(target_qubits) == 1:
+        return _apply_1q(psi, m, target_qubits[0], qubit_number)
+
+    else:
+        return _apply_2q(psi, m, target_qubits[0], target_qubits[1], qubit_number)
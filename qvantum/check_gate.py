@@ -2,17 +2,90 @@
 
 # pylint: disable=E1101, W1401
 
+import functools
 import numpy
+import os
+from . import precision
 from . import qubit
 from . import register
 
+# the checks of gate calls are left out for the whole process if QVANTUM_DISABLE_CHECKS is set 
+# to a non-empty value before qvantum is imported
+_CHECKS_DISABLED = bool(os.environ.get('QVANTUM_DISABLE_CHECKS'))
+
+@functools.lru_cache(maxsize=None)
+def _identity(size):
+    """Function to return a shared read-only identity matrix of the given size.
+    
+    Arguments:
+        size {int} -- Size of the identity matrix
+    """
+
+    id_matrix = numpy.identity(size)
+    id_matrix.setflags(write=False)
+    return id_matrix
+
+def _is_unitary(matrix):
+    """Function to decide whether a square matrix is unitary. The Frobenius norm of the 
+    difference of M^H * M and the identity matrix is compared to the tolerance of the current 
+    precision instead of testing the elements for equality. For small matrices einsum is used 
+    because it has less overhead than the matmul operator on these shapes.
+    
+    Arguments:
+        matrix {numpy.ndarray} -- The tested square matrix
+    """
+
+    if matrix.shape[0] <= 8:
+        rs_matrix = numpy.einsum('ji,jk->ik', matrix.conjugate(), matrix)
+
+    else:
+        rs_matrix = matrix.conjugate().transpose() @ matrix
+
+    return numpy.linalg.norm(rs_matrix - _identity(matrix.shape[0]), ord='fro') < \
+        precision.TOLERANCE
+
+def init_subclass_check(function):
+    """Decorator to check the MATRIX class attribute of a new subclass of gate class.
+    
+    Arguments:
+        function {} -- The tested function
+    """
+
+    def wrapper(cls, **kwargs):
+        """Method to lock the MATRIX class attribute of a subclass when the class is created. 
+        The matrix is converted to a read-only complex array and its unitarity is checked once 
+        here instead of at every initialization.
+
+        Raises:
+            ValueError
+        """
+
+        if 'MATRIX' not in vars(cls):
+            return function(cls, **kwargs)
+
+        matrix = numpy.asarray(cls.MATRIX)
+        if matrix.ndim == 2 and matrix.shape[0] == matrix.shape[1] and matrix.shape[0] >= 2 \
+            and _is_unitary(matrix):
+            return function(cls, **kwargs)
+
+        else:
+            raise ValueError('Invalid input! MATRIX of class must be a unitary matrix.')
+    
+    return wrapper
+
 def gate_call_check(function):
-    """Decorator to check the arguments of call function in gate class.
+    """Decorator to check the arguments of call function in gate class. If the 
+    QVANTUM_DISABLE_CHECKS environment variable is set when qvantum is imported, then the 
+    function is returned unchanged. The unchecked function is available as the __wrapped__ 
+    attribute of the wrapper, which is used by qvantum.disable_checks().
     
     Arguments:
         function {} -- The tested function
     """
 
+    if _CHECKS_DISABLED:
+        return function
+
     def wrapper(self, qr):
         """Method which makes possible to call a gate on a qubit or a register. The only 
         restriction is that the size of the gate and the size of the qubit or regsiter must be 
@@ -41,6 +114,7 @@ def gate_call_check(function):
         else:
             raise TypeError('Invalid input! Argument must be qubit or register object.')
     
+    wrapper.__wrapped__ = function
     return wrapper
 
 def set_name_check(function):
@@ -100,23 +174,21 @@ def set_matrix_check(function):
             >>>
             >>> g = qvantum.Gate()
             >>> g.get_matrix()
-            matrix([[1, 0],
-                    [0, 1]])
-            >>> g.set_matrix(numpy.matrix([
+            array([[1.+0.j, 0.+0.j],
+                   [0.+0.j, 1.+0.j]])
+            >>> g.set_matrix(numpy.array([
                     [1 / numpy.sqrt(2), 1 / numpy.sqrt(2)],
                     [1 / numpy.sqrt(2), -1 / numpy.sqrt(2)]
                     ])
                 )
             >>> g.get_matrix()
-            matrix([[ 0.70710678,  0.70710678],
-                    [ 0.70710678, -0.70710678]])
+            array([[ 0.70710678+0.j,  0.70710678+0.j],
+                   [ 0.70710678+0.j, -0.70710678+0.j]])
         """
 
         if isinstance(matrix, numpy.ndarray):
             if matrix.shape[0] == matrix.shape[1]:
-                id_matrix = numpy.identity(matrix.shape[0])
-                rs_matrix = matrix * matrix.conjugate().transpose()
-                if numpy.array_equal(rs_matrix.round(10), id_matrix):
+                if _is_unitary(matrix):
                     return function(self, matrix)
             
                 else:
@@ -130,6 +202,52 @@ def set_matrix_check(function):
     
     return wrapper
 
+def set_target_qubits_check(function):
+    """Decorator to check the arguments of setting target qubits function.
+    
+    Arguments:
+        function {} -- The tested function
+    """
+
+    def wrapper(self, target_qubits):
+        """Method to set the indices of the qubits of a register which the gate acts on. The 
+        number of the indices must be equal to the number of qubits that the gate acts on. Using 
+        them the gate can be called on a bigger register without building the Kronecker product 
+        of the gate with identity matrices. If the parameter is None, then the gate acts on the 
+        whole register again.
+        
+        Arguments:
+            target_qubits {list, None} -- List of distinct indices of qubits
+        
+        Raises:
+            ValueError, TypeError
+        
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> h = qvantum.Hadamard()
+            >>> h.set_target_qubits([1])
+        """
+
+        if target_qubits is None:
+            return function(self, target_qubits)
+
+        elif isinstance(target_qubits, list) \
+            and all(isinstance(elem, int) for elem in target_qubits):
+            if 2 ** len(target_qubits) == self.get_size() \
+                and len(set(target_qubits)) == len(target_qubits) \
+                and all(elem >= 0 for elem in target_qubits):
+                return function(self, target_qubits)
+
+            else:
+                raise ValueError('Invalid input! Argument must contain as many distinct ' +\
+                    'non-negative indices as the number of qubits that the gate acts on.')
+
+        else:
+            raise TypeError('Invalid input! Argument must be a list of integers or None.')
+    
+    return wrapper
+
 def power_check(function):
     """Decorator to check the arguments of raising a matrix to the given power function.
     
@@ -152,24 +270,24 @@ def power_check(function):
             >>>
             >>> t = qvantum.Toffoli()
             >>> t.get_matrix()
-            matrix([[1, 0, 0, 0, 0, 0, 0, 0],
-                    [0, 1, 0, 0, 0, 0, 0, 0],
-                    [0, 0, 1, 0, 0, 0, 0, 0],
-                    [0, 0, 0, 0, 0, 0, 0, 1],
-                    [0, 0, 0, 0, 1, 0, 0, 0],
-                    [0, 0, 0, 0, 0, 1, 0, 0],
-                    [0, 0, 0, 0, 0, 0, 1, 0],
-                    [0, 0, 0, 1, 0, 0, 0, 0]])
+            array([[1.+0.j, 0.+0.j, 0.+0.j, 0.+0.j, 0.+0.j, 0.+0.j, 0.+0.j, 0.+0.j],
+                   [0.+0.j, 1.+0.j, 0.+0.j, 0.+0.j, 0.+0.j, 0.+0.j, 0.+0.j, 0.+0.j],
+                   [0.+0.j, 0.+0.j, 1.+0.j, 0.+0.j, 0.+0.j, 0.+0.j, 0.+0.j, 0.+0.j],
+                   [0.+0.j, 0.+0.j, 0.+0.j, 0.+0.j, 0.+0.j, 0.+0.j, 0.+0.j, 1.+0.j],
+                   [0.+0.j, 0.+0.j, 0.+0.j, 0.+0.j, 1.+0.j, 0.+0.j, 0.+0.j, 0.+0.j],
+                   [0.+0.j, 0.+0.j, 0.+0.j, 0.+0.j, 0.+0.j, 1.+0.j, 0.+0.j, 0.+0.j],
+                   [0.+0.j, 0.+0.j, 0.+0.j, 0.+0.j, 0.+0.j, 0.+0.j, 1.+0.j, 0.+0.j],
+                   [0.+0.j, 0.+0.j, 0.+0.j, 1.+0.j, 0.+0.j, 0.+0.j, 0.+0.j, 0.+0.j]])
             >>> t.power(2)
             >>> t.get_matrix()
-            matrix([[1, 0, 0, 0, 0, 0, 0, 0],
-                    [0, 1, 0, 0, 0, 0, 0, 0],
-                    [0, 0, 1, 0, 0, 0, 0, 0],
-                    [0, 0, 0, 1, 0, 0, 0, 0],
-                    [0, 0, 0, 0, 1, 0, 0, 0],
-                    [0, 0, 0, 0, 0, 1, 0, 0],
-                    [0, 0, 0, 0, 0, 0, 1, 0],
-                    [0, 0, 0, 0, 0, 0, 0, 1]])
+            array([[1.+0.j, 0.+0.j, 0.+0.j, 0.+0.j, 0.+0.j, 0.+0.j, 0.+0.j, 0.+0.j],
+                   [0.+0.j, 1.+0.j, 0.+0.j, 0.+0.j, 0.+0.j, 0.+0.j, 0.+0.j, 0.+0.j],
+                   [0.+0.j, 0.+0.j, 1.+0.j, 0.+0.j, 0.+0.j, 0.+0.j, 0.+0.j, 0.+0.j],
+                   [0.+0.j, 0.+0.j, 0.+0.j, 1.+0.j, 0.+0.j, 0.+0.j, 0.+0.j, 0.+0.j],
+                   [0.+0.j, 0.+0.j, 0.+0.j, 0.+0.j, 1.+0.j, 0.+0.j, 0.+0.j, 0.+0.j],
+                   [0.+0.j, 0.+0.j, 0.+0.j, 0.+0.j, 0.+0.j, 1.+0.j, 0.+0.j, 0.+0.j],
+                   [0.+0.j, 0.+0.j, 0.+0.j, 0.+0.j, 0.+0.j, 0.+0.j, 1.+0.j, 0.+0.j],
+                   [0.+0.j, 0.+0.j, 0.+0.j, 0.+0.j, 0.+0.j, 0.+0.j, 0.+0.j, 1.+0.j]])
         """
 
         if isinstance(power, int):
@@ -180,6 +298,154 @@ def power_check(function):
     
     return wrapper
 
+def power_unitary_check(function):
+    """Decorator to check the arguments of raising a matrix to the given real power function.
+    
+    Arguments:
+        function {} -- The tested function
+    """
+
+    def wrapper(self, power):
+        """Method to raise the unitary matrix of the gate to the given real power and overwrites 
+        the original matrix of the gate with the results matrix. The matrix is diagonalized and 
+        its eigenvalues are raised to the power, so fractional powers such as the square root of 
+        a gate can be computed as well.
+        
+        Arguments:
+            power {int, float} -- The power which the gate is raised on
+        
+        Raises:
+            TypeError
+        
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> x = qvantum.PauliX()
+            >>> x.power_unitary(0.5)
+            >>> x.get_matrix()
+            array([[0.5+0.5j, 0.5-0.5j],
+                   [0.5-0.5j, 0.5+0.5j]])
+        """
+
+        if isinstance(power, (int, float)):
+            return function(self, power)
+
+        else:
+            raise TypeError('Invalid input! Argument must be integer or float.')
+    
+    return wrapper
+
+def _check_batched_states(gate, states):
+    """Function to check a batch of state vectors which a gate is applied on. It raises an 
+    exception if the states aren't a 2 dimensional array of state vectors which fit the size 
+    and the target qubits of the gate.
+    
+    Arguments:
+        gate {Gate} -- The gate which is applied
+        states {numpy.ndarray} -- State vectors of shape (batch, 2^n)
+    """
+
+    if not isinstance(states, numpy.ndarray) or states.ndim != 2:
+        raise TypeError('Invalid input! Argument must be a 2 dimensional numpy array.')
+
+    if states.shape[0] == 0:
+        raise ValueError('Invalid input! The batch must contain at least one state vector.')
+
+    size = states.shape[1]
+    target_qubits = gate.get_target_qubits()
+    if size < 2 or size & (size - 1) != 0:
+        raise ValueError('Invalid input! The size of the state vectors must be a power of 2.')
+
+    elif target_qubits is None and gate.get_size() != size:
+        raise ValueError('Invalid input! The size of the state vectors must be the same as ' +\
+            'the gate size.')
+
+    elif target_qubits is not None and 2 ** max(target_qubits) >= size:
+        raise ValueError('Invalid input! The state vectors must contain the target qubits ' +\
+            'of the gate.')
+
+def apply_on_check(function):
+    """Decorator to check the arguments of applying gate on qubits of register function.
+    
+    Arguments:
+        function {} -- The tested function
+    """
+
+    def wrapper(self, register_, target_wires):
+        """Method to apply the gate on the given qubits of a register. The gate matrix is 
+        contracted only with the axes of the target qubits of the state vector, so the 
+        Kronecker product of the gate with identity matrices is never built and the memory 
+        usage stays O(2^n) instead of O(4^n). It should be preferred to calling a gate of the 
+        same size as the register for registers with many qubits.
+        
+        Arguments:
+            register {Register} -- The register which the gate is applied on
+            target_wires {list} -- List of distinct indices of qubits of the register
+        
+        Raises:
+            ValueError, TypeError
+        
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> r = qvantum.Register([qvantum.Qubit(1, 0), qvantum.Qubit(1, 0)])
+            >>> qvantum.PauliX().apply_on(r, [1])
+            >>> r.show()
+            '|Ψ> = (0.0000+0.0000i)|00> + (1.0000+0.0000i)|01> + (0.0000+0.0000i)|10> + (0.0000+0.0000i)|11>'
+        """
+
+        if isinstance(register_, register.Register) and isinstance(target_wires, list) \
+            and all(isinstance(elem, int) for elem in target_wires):
+            if 2 ** len(target_wires) == self.get_size() \
+                and len(set(target_wires)) == len(target_wires) \
+                and all(0 <= elem < register_.get_qubit_number() for elem in target_wires):
+                return function(self, register_, target_wires)
+
+            else:
+                raise ValueError('Invalid input! Target wires must contain as many distinct ' +\
+                    'indices of qubits of the register as the number of qubits that the gate ' +\
+                    'acts on.')
+
+        else:
+            raise TypeError('Invalid input! Arguments must be a register and a list of integers.')
+    
+    return wrapper
+
+def apply_batched_check(function):
+    """Decorator to check the arguments of applying gate on a batch of states function.
+    
+    Arguments:
+        function {} -- The tested function
+    """
+
+    def wrapper(self, states):
+        """Method to apply the gate on a batch of state vectors at once and return the results. 
+        Every row of the argument is the state vector of a register. If target qubits are set, 
+        then the gate acts only on the given qubits of the registers, otherwise the size of the 
+        gate and the size of the state vectors must be equal. The whole batch is computed by one 
+        matmul call instead of calling the gate on the registers one by one.
+        
+        Arguments:
+            states {numpy.ndarray} -- State vectors of shape (batch, 2^n)
+        
+        Raises:
+            ValueError, TypeError
+        
+        Examples:
+            >>> import numpy
+            >>> import qvantum
+            >>>
+            >>> h = qvantum.Hadamard()
+            >>> h.apply_batched(numpy.array([[1, 0], [0, 1]]))
+            array([[ 0.70710678+0.j,  0.70710678+0.j],
+                   [ 0.70710678+0.j, -0.70710678+0.j]])
+        """
+
+        _check_batched_states(self, states)
+        return function(self, states)
+    
+    return wrapper
+
 def CNOT_check(function):
     """Decorator to check the arguments of calling Controlled-Not gate.
     
@@ -244,6 +510,55 @@ def Ising_check(function):
     
     return wrapper
 
+def Ising_apply_batched_check(function):
+    """Decorator to check the arguments of applying Ising gate on a batch of states function.
+    
+    Arguments:
+        function {} -- The tested function
+    """
+
+    def wrapper(self, states, phis=None):
+        """Method to apply Ising gates with different angles on a batch of state vectors at once 
+        and return the results. The n-th state vector is transformed by the Ising gate of the n-th 
+        angle, so a parameter sweep is computed by one matmul call. If no angles are given, then 
+        every state vector is transformed by the angle which the gate was initialized with.
+        
+        Arguments:
+            states {numpy.ndarray} -- State vectors of shape (batch, 2^n)
+            phis {list, numpy.ndarray, None} -- The used angles, one for every state vector (default: {None})
+        
+        Raises:
+            ValueError, TypeError
+        
+        Examples:
+            >>> import numpy
+            >>> import qvantum
+            >>>
+            >>> i = qvantum.Ising(0)
+            >>> i.apply_batched(numpy.array([[1, 0, 0, 0], [1, 0, 0, 0]]), [0, numpy.pi / 2])
+            array([[ 0.70710678+0.00000000e+00j,  0.        +0.00000000e+00j,
+                     0.        +0.00000000e+00j,  0.        -7.07106781e-01j],
+                   [ 0.70710678+0.00000000e+00j,  0.        +0.00000000e+00j,
+                     0.        +0.00000000e+00j, -0.70710678-4.32978028e-17j]])
+        """
+
+        _check_batched_states(self, states)
+        if phis is None:
+            return function(self, states)
+
+        elif not isinstance(phis, (list, numpy.ndarray)) or numpy.ndim(phis) != 1 \
+            or not all(isinstance(elem, (int, float, numpy.integer, numpy.floating)) \
+            for elem in phis):
+            raise TypeError('Invalid input! Angles must be a list or array of integers or floats.')
+
+        elif len(phis) != states.shape[0]:
+            raise ValueError('Invalid input! The number of angles must be the same as the ' +\
+                'number of state vectors.')
+
+        return function(self, states, phis)
+    
+    return wrapper
+
 def Toffoli_check(function):
     """Decorator to check the arguments of calling Toffoli gate.
     
@@ -2,171 +2,179 @@
 
 # pylint: disable=E1101, W1401
 
+import collections
 from . import gate
+import operator
 
-def layer_init_check(function):
-    """Decorator to check the arguments of initialization function in layer class.
+_GATE_TYPES = (gate.Gate, gate.Hadamard, gate.SquareNot, gate.PauliX, gate.PauliY, gate.PauliZ, \
+    gate.Phase, gate.Pi8, gate.Swap, gate.SquareSwap, gate.CNOT, gate.ControlledZ, \
+    gate.ControlledPhase, gate.Ising, gate.Toffoli, gate.Fredkin)
+
+# the built-in gate classes are checked by a set lookup, subclasses defined by the user fall back 
+# to isinstance()
+_GATE_TYPE_SET = frozenset(_GATE_TYPES)
+
+# the gates which passed the isinstance() check lately, they are kept alive by the deque so their 
+# ids can't be reused by other objects while they are in the set
+_VALIDATED_GATES = collections.deque(maxlen=256)
+
+_VALIDATED_IDS = set()
+
+_ERR_GATE_LIST = 'Invalid input! Argument must be a list of gate objects.'
+
+_ERR_INDEX = 'Invalid input! Argument must be integer.'
+
+_ERR_INSERT = 'Invalid input! Argument must be a pair of gate object and integer.'
+
+def _is_gate(elem):
+    """Function to decide whether an object is an instance of the Gate class or one of its 
+    subclasses. The accepted objects are remembered in a bounded window, so reusing the same 
+    gate objects in many layers skips the isinstance() check.
     
     Arguments:
-        function {} -- The tested function
+        elem {} -- The tested object
     """
 
-    def wrapper(self, gate_list):
-        """Method to initialize an instance of the Layer class. The argument must be a list of 
-        objects in the Gate class or in an inherited class such as: Hadamard, SquareNot, PauliX, 
-        PauliY, PauliZ, Phase, Pi8, Swap, SquareSwap, CNOT, ControlledZ, ControlledPhase, Ising, 
-        Toffoli, Fredkin.
+    if id(elem) in _VALIDATED_IDS:
+        return True
+
+    elif isinstance(elem, _GATE_TYPES):
+        if len(_VALIDATED_GATES) == _VALIDATED_GATES.maxlen:
+            _VALIDATED_IDS.discard(id(_VALIDATED_GATES[0]))
+
+        _VALIDATED_GATES.append(elem)
+        _VALIDATED_IDS.add(id(elem))
+        return True
+
+    else:
+        return False
+
+try:
+    from ._check_layer import _configure, _validate_gate, _validate_gate_list
+
+except ImportError:
+    def _validate_gate(g, _gate_type_set=_GATE_TYPE_SET):
+        """Function to decide whether an object is an instance of the Gate class or one of its 
+        subclasses. It's replaced by the compiled version of the _check_layer extension module 
+        if it's built.
         
         Arguments:
-            gate_list {list} -- List of objects from Gate class
-        
-        Raises:
-            TypeError
-        
-        Examples:
-            >>> import qvantum
-            >>>
-            >>> l1 = qvantum.Layer([qvantum.Hadamard(), qvantum.Gate()])
-            >>> l1.get_gate_list()
-            OrderedDict([(0, <qvantum.gate.Hadamard at 0x1ae588c2d68>), (1, <qvantum.gate.Gate at 0x1ae56a08a20>)])
-            >>> l2 = qvantum.Layer([qvantum.PauliX()])
-            >>> l2.get_layer_matrix()
-            matrix([[0., 1.],
-                    [1., 0.]])
+            g {} -- The tested object
         """
 
-        if isinstance(gate_list, list) and all(isinstance(elem, (gate.Gate, gate.Hadamard, \
-            gate.SquareNot, gate.PauliX, gate.PauliY, gate.PauliZ, gate.Phase, gate.Pi8, \
-            gate.Swap, gate.SquareSwap, gate.CNOT, gate.ControlledZ, gate.ControlledPhase, \
-            gate.Ising, gate.Toffoli, gate.Fredkin)) for elem in gate_list):
-            return function(self, gate_list)
+        return type(g) in _gate_type_set or _is_gate(g)
+
+    def _validate_gate_list(gate_list, _gate_type_set=_GATE_TYPE_SET):
+        """Function to decide whether all elements of a list are instances of the Gate class or 
+        its subclasses. It's replaced by the compiled version of the _check_layer extension 
+        module if it's built.
         
-        else:
-            raise TypeError('Invalid input! Argument must be a list of gate objects.')
-    
-    return wrapper
+        Arguments:
+            gate_list {list} -- The tested list
+        """
+
+        return all(map(_gate_type_set.__contains__, map(type, gate_list))) \
+            or all(map(_is_gate, gate_list))
+
+else:
+    _configure(_GATE_TYPES, _is_gate)
 
-def get_nth_gate_check(function):
-    """Decorator to check the arguments of getting nth gate function.
+def _index(nth):
+    """Function to convert an index to int. Python integers are accepted by an identity check 
+    of their type, other integer types such as the numpy integers are converted by 
+    operator.index(). The return value is None if the object isn't an integer.
     
     Arguments:
-        function {} -- The tested function
+        nth {} -- The tested index
     """
 
-    def wrapper(self, nth):
-        """Method to return the n-th gate in the current Layer object. The parameter must be 
-        between 0 and the actual number of the gates.
-        
-        Arguments:
-            nth {int} -- Number of n-th possible gate
-        
-        Raises:
-            TypeError
-        
-        Examples:
-            >>> import qvantum
-            >>>
-            >>> l = qvantum.Layer([qvantum.Hadamard(), qvantum.Gate()])
-            >>> l.get_nth_gate(0)
-            <qvantum.gate.Hadamard at 0x1ae588c2d68>
-            >>> l.get_nth_gate(1)
-            <qvantum.gate.Gate at 0x1ae56a08a20>
-        """
+    if type(nth) is int:
+        return nth
 
-        if isinstance(nth, int):
-            return function(self, nth)
+    try:
+        return operator.index(nth)
 
-        else:
-            raise TypeError('Invalid input! Argument must be integer.')
-    
-    return wrapper
+    except TypeError:
+        return None
 
+# source of the wrapper factory compiled by _make_check, the wrapper gets the parameter names of 
+# the wrapped method so it can be called with keyword arguments
+_WRAPPER_SOURCE = """def _factory(validator, function, error):
+    def wrapper(self, {params}):
+        checked = validator({params})
+        if checked is not None:
+            return function(self, {passed}checked)
 
-def delete_gate_check(function):
-    """Decorator to check the arguments of deleting gate function.
+        raise TypeError(error)
+
+    return wrapper
+"""
+
+def _make_check(validator, error):
+    """Function to create a decorator which checks the arguments of a method in layer class. 
+    The wrapper is generated with the same parameters as the wrapped method and it gets the 
+    docstring of the method. The validator is called with the arguments and returns the last one 
+    converted or None if the arguments are invalid, the other arguments are passed on unchanged. 
+    If Python runs with the -O option, then the method is returned unchanged.
     
     Arguments:
-        function {} -- The tested function
+        validator {function} -- Function which checks the arguments of the method
+        error {str} -- Message of the TypeError raised for invalid arguments
     """
 
-    def wrapper(self, nth):
-        """Method to delete the n-th gate from the current Layer object. The parameter must be 
-        equal to or bigger than 0 and less than the actual size of the Layer.
-        
-        Arguments:
-            nth {int} -- Number of n-th possible gate
-        
-        Raises:
-            ValueError, TypeError
-        
-        Examples:
-            >>> import qvantum
-            >>>
-            >>> l = qvantum.Layer([qvantum.Hadamard(), qvantum.Gate(), qvantum.PauliX()])
-            >>> l.get_gate_list()
-            OrderedDict([(0, <qvantum.gate.Hadamard at 0x1ae59262ba8>), (1, <qvantum.gate.Gate at 0x1ae58146ba8>), (2, <qvantum.gate.PauliX at 0x1ae59262d30>)])
-            >>> l.delete_gate(0)
-            >>> l.get_gate_list()
-            OrderedDict([(0, <qvantum.gate.Gate at 0x1cff211fda0>), (1, <qvantum.gate.PauliX at 0x1cff3f5f4a8>)])
-        """
+    def decorator(function):
+        if not __debug__:
+            return function
 
-        if isinstance(nth, int):
-            return function(self, nth)
-        
-        else:
-            raise TypeError('Invalid input! Argument must be integer.')
-    
-    return wrapper
+        params = function.__code__.co_varnames[1:function.__code__.co_argcount]
+        namespace = {}
+        exec(_WRAPPER_SOURCE.format(params=', '.join(params), \
+            passed=''.join(elem + ', ' for elem in params[:-1])), namespace)
+        wrapper = namespace['_factory'](validator, function, error)
+        wrapper.__doc__ = function.__doc__
+        return wrapper
+
+    return decorator
 
-def insert_gate_check(function):
-    """Decorator to check the arguments of inserting gate function.
+def _gate_list_arg(gate_list):
+    """Function to check the argument of initialization function in layer class. The argument 
+    must be a list of objects in the Gate class or in an inherited class.
     
     Arguments:
-        function {} -- The tested function
+        gate_list {list} -- The tested list
     """
 
-    def wrapper(self, g, nth):
-        """Method to insert a Gate object into the n-th place in the current Layer object. The 
-        first parameter must be a Gate object or an object in an inherited class such as: 
-        Hadamard, SquareNot, PauliX, PauliY, PauliZ, Phase, Pi8, Swap, SquareSwap, CNOT, 
-        ControlledZ, ControlledPhase, Ising, Toffoli, Fredkin. The second parameter must be equal 
-        to or bigger than 0 and equal to or less than the actual size of the Layer.
-        
-        Arguments:
-            g {gate} -- The gate to be inserted
-            nth {int} -- The index where the gate is inserted
-        
-        Raises:
-            ValueError, TypeError
-        
-        Examples:
-            >>> import qvantum
-            >>>
-            >>> l = qvantum.Layer([qvantum.Hadamard(), qvantum.Gate(), qvantum.PauliX()])
-            >>> l.get_gate_list()
-            OrderedDict([(0, <qvantum.gate.Hadamard at 0x1ae59262ba8>), (1, <qvantum.gate.Gate at 0x1ae58146ba8>), (2, <qvantum.gate.PauliX at 0x1ae59262d30>)])
-            >>> l.insert_gate(qvantum.PauliY(), 1)
-            >>> l.get_gate_list()
-            OrderedDict([(0, <qvantum.gate.Hadamard at 0x1ae59266470>),
-                         (1, <qvantum.gate.PauliY at 0x1ae5923d400>),
-                         (2, <qvantum.gate.Gate at 0x1ae59266438>),
-                         (3, <qvantum.gate.PauliX at 0x1ae59266390>)])
-            >>> l.insert_gate(qvantum.PauliY(), 4)
-            >>> l.get_gate_list()
-            OrderedDict([(0, <qvantum.gate.Hadamard at 0x1ae59266470>),
-                         (1, <qvantum.gate.PauliY at 0x1ae5923d400>),
-                         (2, <qvantum.gate.Gate at 0x1ae59266438>),
-                         (3, <qvantum.gate.PauliX at 0x1ae59266390>),
-                         (4, <qvantum.gate.PauliY at 0x1ae59266400>)])
-        """
+    if isinstance(gate_list, list) and _validate_gate_list(gate_list):
+        return gate_list
 
-        if isinstance(g, (gate.Gate, gate.Hadamard, gate.SquareNot, gate.PauliX, gate.PauliY, \
-            gate.PauliZ, gate.Phase, gate.Pi8, gate.Swap, gate.SquareSwap, gate.CNOT, \
-            gate.ControlledZ, gate.ControlledPhase, gate.Ising, gate.Toffoli, gate.Fredkin)) \
-            and isinstance(nth, int):
-            return function(self, g, nth)
-        
-        else:
-            raise TypeError('Invalid input! Argument must be a pair of gate object and integer.')
+    return None
+
+def _insert_arg(g, nth, _gate_type_set=_GATE_TYPE_SET):
+    """Function to check the arguments of inserting gate function. The arguments must be a pair 
+    of an object in the Gate class or in an inherited class and an integer. The cheap type 
+    identity checks of the index and the built-in gate classes come first, the index is checked 
+    before the gate in the slower path as well. The return value is the index.
     
-    return wrapper
+    Arguments:
+        g {} -- The tested gate
+        nth {} -- The tested index
+    """
+
+    if type(nth) is int and type(g) in _gate_type_set:
+        return nth
+
+    nth = _index(nth)
+    if nth is not None and _validate_gate(g):
+        return nth
+
+    return None
+
+# decorators to check the arguments of the initialization, getting nth gate, deleting gate and 
+# inserting gate functions in layer class
+layer_init_check = _make_check(_gate_list_arg, _ERR_GATE_LIST)
+
+get_nth_gate_check = _make_check(_index, _ERR_INDEX)
+
+delete_gate_check = _make_check(_index, _ERR_INDEX)
+
+insert_gate_check = _make_check(_insert_arg, _ERR_INSERT)
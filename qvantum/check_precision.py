@@ -0,0 +1,44 @@
+'''checking functions for precision of the simulation'''
+
+# pylint: disable=E1101, W1401
+
+def set_precision_check(function):
+    """Decorator to check the arguments of setting precision function.
+    
+    Arguments:
+        function {} -- The tested function
+    """
+
+    def wrapper(precision):
+        """This function sets the precision of the matrices of the gates created afterwards and 
+        of the state vectors which the gates are applied on. The tolerance of the unitarity check 
+        is 1e-5 with single and 1e-10 with double precision, the sum of the squared amplitudes is 
+        checked up to 5 and 10 decimals respectively. The gates built with signed permutation matrices are 
+        exact in both precisions.
+        
+        Arguments:
+            precision {str} -- Possible values: 'single' or 'double'
+        
+        Raises:
+            ValueError, TypeError
+        
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> qvantum.set_precision('single')
+            >>> qvantum.PauliX().get_matrix()
+            array([[0.+0.j, 1.+0.j],
+                   [1.+0.j, 0.+0.j]], dtype=complex64)
+        """
+
+        if isinstance(precision, str):
+            if precision in ('single', 'double'):
+                return function(precision)
+
+            else:
+                raise ValueError('Invalid input! Argument must be \'single\' or \'double\'.')
+
+        else:
+            raise TypeError('Invalid input! Argument must be string.')
+    
+    return wrapper
@@ -2,6 +2,8 @@
 
 # pylint: disable=E1101, W1401
 
+from . import precision
+
 def qubit_init_check(function):
     """Decorator to check the arguments of initialization function in qubit class.
     
@@ -32,7 +34,7 @@ def qubit_init_check(function):
         """
 
         if all(isinstance(elem, (int, float, complex)) for elem in [alpha, beta]):
-            if round(abs(alpha) ** 2 + abs(beta) ** 2 - 1, 10) == 0:
+            if round(abs(alpha) ** 2 + abs(beta) ** 2 - 1, precision.DECIMALS) == 0:
                 return function(self, alpha, beta)
         
             else:
@@ -75,7 +77,7 @@ def set_amplitudes_check(function):
         """
 
         if all(isinstance(elem, (int, float, complex)) for elem in [alpha, beta]):
-            if round(abs(alpha) ** 2 + abs(beta) ** 2 - 1, 10) == 0:
+            if round(abs(alpha) ** 2 + abs(beta) ** 2 - 1, precision.DECIMALS) == 0:
                 return function(self, alpha, beta)
         
             else:
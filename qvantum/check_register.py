@@ -3,6 +3,7 @@
 # pylint: disable=E1101, W1401
 
 import numpy
+from . import precision
 from . import qubit
 
 def register_init_check(function):
@@ -160,7 +161,8 @@ def set_amplitudes_check(function):
 
         if isinstance(amp_list, list) \
             and all(isinstance(elem, (int, float, complex)) for elem in amp_list):
-            if round(numpy.sum(numpy.square(numpy.absolute(amp_list))) - 1, 10) == 0:
+            if round(numpy.sum(numpy.square(numpy.absolute(amp_list))) - 1, \
+                precision.DECIMALS) == 0:
                 return function(self, amp_list)
 
             else:
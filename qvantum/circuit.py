@@ -5,7 +5,7 @@
 from . import check_circuit
 import collections
 import copy
-import numpy
+from . import gate
 
 class Circuit(object):
     """circuit class
@@ -259,9 +259,9 @@ class Circuit(object):
         if r.get_qubit_number() == self.get_circuit_size():
             for key in self.__layer_list:
 
-                vector = numpy.asarray(self.__layer_list[key].get_layer_matrix() * \
-                    r.ket()).flatten()
-                r.set_amplitudes(list(vector))
+                vector = gate._apply_dense(self.__layer_list[key].get_layer_matrix(), \
+                    r.ket().ravel())
+                gate._store_amplitudes(r, vector)
 
         else:
             raise ValueError('Invalid input! Register must have the same size as the layers.')
@@ -2,12 +2,436 @@
 
 # pylint: disable=E1101, W1401
 
+from . import _kernels
+import cmath
 from . import check_gate
+import contextlib
+import functools
 import numpy
+from . import precision
 from . import qubit
 from . import register
 import unicodedata
 
+def _read_only(matrix):
+    """Function to lock a matrix which is shared between gate instances. The matrices of the 
+    built-in gates never change so they are created once and reused by every instance.
+    
+    Arguments:
+        matrix {numpy.ndarray} -- The matrix to be locked
+    """
+
+    matrix.setflags(write=False)
+    return matrix
+
+_PERMUTATIONS = {}
+
+def _signed_permutation(matrix):
+    """Function to lock a shared gate matrix which is a signed permutation matrix and to store 
+    the permutation and the signs of its rows. Calling such a gate on a register only reorders 
+    the amplitudes and flips the sign of some of them, so no multiplication with the zero and one 
+    elements of the matrix is needed. The permutation is None if the matrix is diagonal and the 
+    signs are None if all of them are equal to 1.
+    
+    Arguments:
+        matrix {numpy.ndarray} -- The matrix to be locked
+    """
+
+    permutation = numpy.argmax(numpy.absolute(matrix), axis=1)
+    signs = matrix[numpy.arange(matrix.shape[0]), permutation].real
+    if numpy.array_equal(permutation, numpy.arange(matrix.shape[0])):
+        permutation = None
+
+    if numpy.all(signs == 1):
+        signs = None
+
+    _PERMUTATIONS[id(matrix)] = (matrix, permutation, signs)
+    return _read_only(matrix)
+
+_REAL_PARTS = {}
+
+def _real_valued(matrix):
+    """Function to lock a shared gate matrix which has no imaginary part and to store its real 
+    part, so it's applied on the real and imaginary parts of the amplitudes separately without 
+    testing the matrix at every call. Only the constants of this module are registered, so the 
+    registry can't grow at runtime.
+    
+    Arguments:
+        matrix {numpy.ndarray} -- The matrix to be locked
+    """
+
+    _REAL_PARTS[id(matrix)] = (matrix, _read_only(numpy.ascontiguousarray(matrix.real)))
+    return _read_only(matrix)
+
+_INV_SQRT2 = 1 / numpy.sqrt(2)
+
+_PI8_PHASE = complex(numpy.cos(numpy.pi / 4), numpy.sin(numpy.pi / 4))
+
+_PI8_NAME = unicodedata.lookup('GREEK SMALL LETTER PI') + '/8'
+
+_IDENTITY_M = _signed_permutation(numpy.array([
+    [1, 0],
+    [0, 1]
+    ], dtype=numpy.complex128))
+
+_HADAMARD_M = _real_valued(numpy.array([
+    [_INV_SQRT2, _INV_SQRT2],
+    [_INV_SQRT2, -1 * _INV_SQRT2]
+    ], dtype=numpy.complex128))
+
+_SQUARENOT_M = _read_only(numpy.array([
+    [(1 + complex(0, 1)) / 2, (1 - complex(0, 1)) / 2],
+    [(1 - complex(0, 1)) / 2, (1 + complex(0, 1)) / 2]
+    ], dtype=numpy.complex128))
+
+_PAULIX_M = _signed_permutation(numpy.array([
+    [0, 1],
+    [1, 0]
+    ], dtype=numpy.complex128))
+
+_PAULIY_M = _read_only(numpy.array([
+    [0, complex(0, -1)],
+    [complex(0, 1), 0]
+    ], dtype=numpy.complex128))
+
+_PAULIZ_M = _signed_permutation(numpy.array([
+    [1, 0],
+    [0, -1]
+    ], dtype=numpy.complex128))
+
+_PHASE_M = _read_only(numpy.array([
+    [1, 0],
+    [0, complex(0, 1)]
+    ], dtype=numpy.complex128))
+
+_PI8_M = _read_only(numpy.array([
+    [1, 0],
+    [0, _PI8_PHASE]
+    ], dtype=numpy.complex128))
+
+_SWAP_M = _signed_permutation(numpy.array([
+    [1, 0, 0, 0],
+    [0, 0, 1, 0],
+    [0, 1, 0, 0],
+    [0, 0, 0, 1]
+    ], dtype=numpy.complex128))
+
+_SQUARESWAP_M = _read_only(numpy.array([
+    [1, 0, 0, 0],
+    [0, (1 + complex(0, 1)) / 2, (1 - complex(0, 1)) / 2, 0],
+    [0, (1 - complex(0, 1)) / 2, (1 + complex(0, 1)) / 2, 0],
+    [0, 0, 0, 1]
+    ], dtype=numpy.complex128))
+
+_CONTROLLEDZ_M = _signed_permutation(numpy.array([
+    [1, 0, 0, 0],
+    [0, 1, 0, 0],
+    [0, 0, 1, 0],
+    [0, 0, 0, -1]
+    ], dtype=numpy.complex128))
+
+_CONTROLLEDPHASE_M = _read_only(numpy.array([
+    [1, 0, 0, 0],
+    [0, 1, 0, 0],
+    [0, 0, 1, 0],
+    [0, 0, 0, complex(0, 1)]
+    ], dtype=numpy.complex128))
+
+_CNOT_ROWS = {(0, 1): (2, 3), (1, 0): (1, 3)}
+
+_TOFFOLI_ROWS = {0: (3, 7), 1: (5, 7), 2: (6, 7)}
+
+_FREDKIN_ROWS = {0: (5, 6), 1: (3, 6), 2: (3, 5)}
+
+def _swapped_identity(size, rows):
+    """Function to return an identity matrix with two of its rows swapped. The matrices of the 
+    Controlled-Not, Toffoli and Fredkin gates are all built this way.
+    
+    Arguments:
+        size {int} -- Size of the matrix
+        rows {tuple} -- Pair of indices of the swapped rows
+    """
+
+    matrix = numpy.identity(size, dtype=numpy.complex128)
+    matrix[list(rows)] = matrix[list(reversed(rows))]
+    return _signed_permutation(matrix)
+
+@functools.lru_cache(maxsize=None)
+def _cnot_matrix(control_qubit, target_qubit):
+    """Function to return the shared matrix of the Controlled-Not gate.
+
+    Arguments:
+        control_qubit {int} -- Possible values: 0 or 1
+        target_qubit {int} -- Possible values: 0 or 1
+    """
+
+    return _swapped_identity(4, _CNOT_ROWS[(control_qubit, target_qubit)])
+
+@functools.lru_cache(maxsize=1024)
+def _ising_matrix(phi):
+    """Function to return the shared matrix of the Ising gate. The angle is expected to be 
+    rounded to 12 decimals, so the same angle computed in different ways hits the same cache 
+    entry. The cache is bounded because parameter sweeps can produce any number of angles.
+
+    Arguments:
+        phi {float} -- The used angle
+    """
+
+    e_phi = cmath.exp(complex(0, phi))
+    return _read_only(numpy.array([
+        [1, 0, 0, complex(0, -1) * e_phi],
+        [0, 1, complex(0, -1), 0],
+        [0, complex(0, -1), 1, 0],
+        [complex(0, -1) * e_phi.conjugate(), 0, 0, 1]
+        ], dtype=numpy.complex128) * _INV_SQRT2)
+
+@functools.lru_cache(maxsize=None)
+def _toffoli_matrix(target_qubit):
+    """Function to return the shared matrix of the Toffoli gate.
+
+    Arguments:
+        target_qubit {int} -- Possible values: 0, 1 or 2
+    """
+
+    return _swapped_identity(8, _TOFFOLI_ROWS[target_qubit])
+
+@functools.lru_cache(maxsize=None)
+def _fredkin_matrix(control_qubit):
+    """Function to return the shared matrix of the Fredkin gate.
+
+    Arguments:
+        control_qubit {int} -- Possible values: 0, 1 or 2
+    """
+
+    return _swapped_identity(8, _FREDKIN_ROWS[control_qubit])
+
+@functools.lru_cache(maxsize=None)
+def _identity_matrix(size):
+    """Function to return the shared identity matrix of the given size.
+
+    Arguments:
+        size {int} -- Size of the matrix
+    """
+
+    return _signed_permutation(numpy.identity(size, dtype=numpy.complex128))
+
+_CASTS = {}
+
+def _cast(matrix):
+    """Function to convert a gate matrix to the precision which is set by 
+    qvantum.set_precision(). The shared signed permutation matrices are converted only once and 
+    the converted copies are registered with the same permutation and signs.
+    
+    Arguments:
+        matrix {numpy.ndarray} -- Matrix of the gate
+    """
+
+    dtype = numpy.dtype(precision.DEFAULT_DTYPE)
+    if matrix.dtype == dtype or id(matrix) not in _PERMUTATIONS:
+        return numpy.asarray(matrix, dtype=dtype)
+
+    if (id(matrix), dtype) not in _CASTS:
+        cast = matrix.astype(dtype)
+        _PERMUTATIONS[id(cast)] = (cast,) + _PERMUTATIONS[id(matrix)][1:]
+        _CASTS[(id(matrix), dtype)] = (matrix, _read_only(cast))
+
+    return _CASTS[(id(matrix), dtype)][1]
+
+def _real_part(matrix):
+    """Function to return the real part of a gate matrix as a contiguous array if the matrix 
+    has no imaginary part. The return value is None if the matrix is complex-valued. The real 
+    parts of the shared real-valued constants are registered by _real_valued() and aren't 
+    computed again.
+    
+    Arguments:
+        matrix {numpy.ndarray} -- Matrix of the gate
+    """
+
+    if id(matrix) in _REAL_PARTS:
+        return _REAL_PARTS[id(matrix)][1]
+
+    elif numpy.any(matrix.imag):
+        return None
+
+    else:
+        return numpy.ascontiguousarray(matrix.real)
+
+def _split_complex(vector):
+    """Function to return a real view of a flat complex state vector with shape (2^n, 2), where 
+    the two columns are the real and the imaginary parts of the amplitudes. A real-valued matrix 
+    acts on both columns independently, so it can be applied with real arithmetic only, which 
+    needs half of the operations of the complex product.
+    
+    Arguments:
+        vector {numpy.ndarray} -- Flat state vector of the register
+    """
+
+    vector = numpy.ascontiguousarray(vector)
+    return vector.view(vector.real.dtype).reshape(-1, 2)
+
+def _merge_complex(tensor):
+    """Function to return the flat complex state vector of a real tensor whose last axis holds 
+    the real and the imaginary parts of the amplitudes.
+    
+    Arguments:
+        tensor {numpy.ndarray} -- Real tensor returned by a real-valued matrix
+    """
+
+    tensor = numpy.ascontiguousarray(tensor)
+    return tensor.view(numpy.result_type(tensor.dtype, numpy.complex64)).reshape(-1)
+
+def _apply_dense(matrix, vector):
+    """Function to multiply the state vector of a register with a gate matrix of the same size. 
+    Real-valued matrices are applied on the real and imaginary parts of the amplitudes 
+    separately.
+    
+    Arguments:
+        matrix {numpy.ndarray} -- Matrix of the gate
+        vector {numpy.ndarray} -- Flat state vector of the register
+    """
+
+    real = _real_part(matrix)
+    if real is None:
+        return matrix @ vector
+
+    else:
+        return _merge_complex(real @ _split_complex(vector))
+
+def _apply_permutation(matrix, vector, target_qubits, qubit_number):
+    """Function to apply a gate with signed permutation matrix on a register state vector. If 
+    target qubits are given, then only the axes of these qubits are permuted. The return value 
+    is None if the matrix isn't one of the shared signed permutation matrices.
+    
+    Arguments:
+        matrix {numpy.ndarray} -- Matrix of the gate
+        vector {numpy.ndarray} -- Flat state vector of the register
+        target_qubits {list, None} -- Indices of the qubits which the gate acts on
+        qubit_number {int} -- Number of qubits in the register
+    """
+
+    if id(matrix) not in _PERMUTATIONS:
+        return None
+
+    permutation, signs = _PERMUTATIONS[id(matrix)][1:]
+    axis = 0
+    if target_qubits is None:
+        tensor = vector.reshape(-1, 1)
+
+    elif len(target_qubits) == 1:
+        tensor = vector.reshape(2 ** target_qubits[0], 2, -1)
+        axis = 1
+
+    else:
+        k = len(target_qubits)
+        tensor = numpy.moveaxis(vector.reshape((2,) * qubit_number), list(target_qubits), \
+            list(range(k)))
+        shape = tensor.shape
+        tensor = tensor.reshape(2 ** k, -1)
+
+    if permutation is None:
+        tensor = numpy.array(tensor)
+
+    else:
+        tensor = numpy.take(tensor, permutation, axis=axis)
+
+    if signs is not None:
+        tensor *= signs.reshape(-1, 1)
+
+    if target_qubits is not None and len(target_qubits) > 1:
+        tensor = numpy.moveaxis(tensor.reshape(shape), list(range(k)), list(target_qubits))
+
+    return tensor.reshape(-1)
+
+def _apply_structured(matrix, vector, target_qubits, qubit_number):
+    """Function to apply the matrix of a gate on the given qubits of a register state vector 
+    without expanding the matrix to the size of the whole register. The state vector is 
+    reshaped so that every qubit has its own axis and the matrix is contracted only with the 
+    axes of the target qubits, so the cost is O(2^n) instead of O(4^n). If Numba is installed, 
+    one and two qubit gates are applied by the compiled kernels instead. Gates with signed 
+    permutation matrices only reorder the amplitudes and real-valued matrices are applied on the 
+    real and imaginary parts of the amplitudes separately, unless the least significant qubit is 
+    one of the targets.
+    
+    Arguments:
+        matrix {numpy.ndarray} -- Matrix of the gate
+        vector {numpy.ndarray} -- Flat state vector of the register
+        target_qubits {list} -- Indices of the qubits which the gate acts on
+        qubit_number {int} -- Number of qubits in the register
+    """
+
+    vector_p = _apply_permutation(matrix, vector, target_qubits, qubit_number)
+    k = len(target_qubits)
+    if vector_p is not None:
+        return vector_p
+
+    elif _kernels.NUMBA_AVAILABLE and k <= 2:
+        return _kernels.apply(matrix, vector, target_qubits, qubit_number)
+
+    # the split adds a trailing axis of size 2, which makes the contraction slower than the 
+    # complex one if the least significant qubit is a target and no other axis follows it
+    real = None if qubit_number - 1 in target_qubits else _real_part(matrix)
+    if real is not None:
+        matrix = real
+        vector = _split_complex(vector)
+
+    if k == 1:
+        tensor = vector.reshape(2 ** target_qubits[0], 2, -1)
+        tensor = numpy.einsum('ij,ajb->aib', matrix, tensor)
+
+    else:
+        tensor = vector.reshape((2,) * qubit_number + vector.shape[1:])
+        tensor = numpy.tensordot(matrix.reshape((2,) * (2 * k)), tensor, \
+            axes=(list(range(k, 2 * k)), list(target_qubits)))
+        tensor = numpy.moveaxis(tensor, list(range(k)), list(target_qubits))
+
+    if real is not None:
+        return _merge_complex(tensor)
+
+    return tensor.reshape(-1)
+
+def _apply_batched(matrix, states, target_qubits):
+    """Function to apply the matrix of a gate on a batch of register state vectors at once. The 
+    target qubits are moved next to the batch axis, so the whole batch is computed by one 
+    matmul call. The matrix can also be a stack of matrices with one matrix for every state.
+    
+    Arguments:
+        matrix {numpy.ndarray} -- Matrix of the gate or stack of matrices of shape (batch, m, m)
+        states {numpy.ndarray} -- State vectors of shape (batch, 2^n)
+        target_qubits {list, None} -- Indices of the qubits which the gate acts on
+    """
+
+    states = numpy.asarray(states, dtype=precision.DEFAULT_DTYPE)
+    batch = states.shape[0]
+    qubit_number = states.shape[1].bit_length() - 1
+    if target_qubits is None:
+        target_qubits = list(range(qubit_number))
+
+    k = len(target_qubits)
+    axes = [elem + 1 for elem in target_qubits]
+    tensor = numpy.moveaxis(states.reshape((batch,) + (2,) * qubit_number), axes, \
+        list(range(1, k + 1)))
+    shape = tensor.shape
+    tensor = numpy.matmul(matrix, tensor.reshape(batch, 2 ** k, -1))
+    tensor = numpy.moveaxis(tensor.reshape(shape), list(range(1, k + 1)), axes)
+    return tensor.reshape(batch, -1)
+
+def _store_amplitudes(register_, vector):
+    """Function to write the state vector computed by a gate back into a register. The 
+    register keeps its amplitudes as complex numbers with double precision, so a vector computed 
+    with single precision is widened and renormalized, otherwise its rounding error would add up 
+    gate by gate until the normalization check of the register fails.
+    
+    Arguments:
+        register_ {Register} -- The register which the gate is applied on
+        vector {numpy.ndarray} -- The new state vector of the register
+    """
+
+    if vector.dtype != numpy.complex128:
+        vector = vector.astype(numpy.complex128)
+        vector /= numpy.linalg.norm(vector)
+
+    register_._set_amplitudes_unchecked(vector.tolist())
+
 class Gate(object):
     """gate class
 
@@ -32,11 +456,38 @@ class Gate(object):
     - get_name()      - getter of name of gate
     - get_matrix()    - getter of matrix of gate
     - get_size()      - getter of size of matrix of gate
+    - get_target_qubits() - getter of the qubits of a register which the gate acts on
     - set_name()      - setter of name of gate
     - set_matrix()    - setter of matrix of gate
+    - set_target_qubits() - setter of the qubits of a register which the gate acts on
     - power()         - raise the matrix of gate to the given power
+    - power_unitary() - raise the matrix of gate to the given real power
+    - apply_on()      - apply the gate on the given qubits of a register
+    - apply_batched() - apply the gate on a batch of state vectors
+
+    The subclasses with a constant matrix define it as the MATRIX class attribute, which is 
+    assigned by __init__() without checking it again. The parametric gates provide the 
+    MATRIX_FACTORY() class method instead.
     """
 
+    MATRIX = _IDENTITY_M
+
+    @check_gate.init_subclass_check
+    def __init_subclass__(cls, **kwargs):
+        """Method to lock the MATRIX class attribute of a subclass when the class is created. 
+        The matrix is converted to a read-only complex array and its unitarity is checked once 
+        here instead of at every initialization.
+
+        Raises:
+            ValueError
+        """
+
+        # super().__init_subclass__(**kwargs)
+        super(Gate, cls).__init_subclass__(**kwargs)
+        if 'MATRIX' in vars(cls) and (not isinstance(cls.MATRIX, numpy.ndarray) \
+            or cls.MATRIX.flags.writeable):
+            cls.MATRIX = _read_only(numpy.array(cls.MATRIX, dtype=numpy.complex128))
+
     def __init__(self):
         """Method to initialize a 2x2 sized identity matrix. Every identity matrix is a unitary 
         matrix as well.
@@ -48,23 +499,24 @@ class Gate(object):
             >>> g.get_name()
             'Identity'
             >>> g.get_matrix()
-            matrix([[1, 0],
-                    [0, 1]])
+            array([[1.+0.j, 0.+0.j],
+                   [0.+0.j, 1.+0.j]])
             >>> g.get_size()
             2
         """
 
         self.__gate_name = 'Identity'
-        self.__gate_matrix = numpy.matrix([
-            [1, 0],
-            [0, 1]
-            ])
+        self.__gate_matrix = _cast(type(self).MATRIX)
+        self.__target_qubits = None
 
     @check_gate.gate_call_check
     def __call__(self, qr):
         """Method which makes possible to call a gate on a qubit or a register. The only 
         restriction is that the size of the gate and the size of the qubit or regsiter must be 
-        equal to each other.
+        equal to each other. If target qubits are set for the gate, then it can be called on a 
+        bigger register as well and it acts only on the given qubits of the register. For 
+        registers with many qubits apply_on() should be used instead of expanding the gate to 
+        the size of the register.
         
         Arguments:
             qr {Qubit, Register} -- The qubit or register which the gate is called on
@@ -84,12 +536,31 @@ class Gate(object):
         """
 
         if isinstance(qr, (qubit.Qubit, qubit.Random_Qubit)) and self.get_size() == 2:
-            vector = self.__gate_matrix * qr.ket()
-            qr.set_amplitudes(vector.item(0), vector.item(1))
+            m00, m01, m10, m11 = self.__gate_matrix.ravel().tolist()
+            alpha = qr.get_alpha()
+            beta = qr.get_beta()
+            alpha, beta = m00 * alpha + m01 * beta, m10 * alpha + m11 * beta
+            if self.__gate_matrix.dtype != numpy.complex128:
+                # the single precision matrix is unitary only up to its rounding error
+                norm = (abs(alpha) ** 2 + abs(beta) ** 2) ** 0.5
+                alpha, beta = alpha / norm, beta / norm
+
+            qr._set_amplitudes_unchecked(alpha, beta)
         
+        elif isinstance(qr, register.Register) and self.__target_qubits is not None \
+            and self.get_size() == 2 ** len(self.__target_qubits) \
+            and max(self.__target_qubits) < qr.get_qubit_number():
+            vector = _apply_structured(self.__gate_matrix, qr.ket().ravel(), \
+                self.__target_qubits, qr.get_qubit_number())
+            _store_amplitudes(qr, vector)
+
         elif isinstance(qr, register.Register) and self.get_size() == qr.get_state_number():
-            vector = numpy.asarray(self.__gate_matrix * qr.ket()).flatten()
-            qr.set_amplitudes(list(vector))
+            vector = _apply_permutation(self.__gate_matrix, qr.ket().ravel(), None, \
+                qr.get_qubit_number())
+            if vector is None:
+                vector = _apply_dense(self.__gate_matrix, qr.ket().ravel())
+
+            _store_amplitudes(qr, vector)
         
         else:
             raise ValueError('Invalid input! Use qubit or register as input with the same size ' +\
@@ -116,10 +587,10 @@ class Gate(object):
             >>>
             >>> c = qvantum.CNOT(0, 1)
             >>> c.get_matrix()
-            matrix([[1, 0, 0, 0],
-                    [0, 1, 0, 0],
-                    [0, 0, 0, 1],
-                    [0, 0, 1, 0]])
+            array([[1.+0.j, 0.+0.j, 0.+0.j, 0.+0.j],
+                   [0.+0.j, 1.+0.j, 0.+0.j, 0.+0.j],
+                   [0.+0.j, 0.+0.j, 0.+0.j, 1.+0.j],
+                   [0.+0.j, 0.+0.j, 1.+0.j, 0.+0.j]])
         """
 
         return self.__gate_matrix
@@ -136,6 +607,22 @@ class Gate(object):
         """
 
         return self.__gate_matrix.shape[0]
+
+    def get_target_qubits(self):
+        """Method to return the indices of the qubits of a register which the gate acts on. If 
+        they aren't set, then the return value is None and the gate acts on the whole register.
+
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> c = qvantum.CNOT(0, 1)
+            >>> c.get_target_qubits()
+            >>> c.set_target_qubits([2, 0])
+            >>> c.get_target_qubits()
+            [2, 0]
+        """
+
+        return self.__target_qubits
     
     @check_gate.set_name_check
     def set_name(self, name):
@@ -176,20 +663,61 @@ class Gate(object):
             >>>
             >>> g = qvantum.Gate()
             >>> g.get_matrix()
-            matrix([[1, 0],
-                    [0, 1]])
-            >>> g.set_matrix(numpy.matrix([
+            array([[1.+0.j, 0.+0.j],
+                   [0.+0.j, 1.+0.j]])
+            >>> g.set_matrix(numpy.array([
                     [1 / numpy.sqrt(2), 1 / numpy.sqrt(2)],
                     [1 / numpy.sqrt(2), -1 / numpy.sqrt(2)]
                     ])
                 )
             >>> g.get_matrix()
-            matrix([[ 0.70710678,  0.70710678],
-                    [ 0.70710678, -0.70710678]])
+            array([[ 0.70710678+0.j,  0.70710678+0.j],
+                   [ 0.70710678+0.j, -0.70710678+0.j]])
         """
     
-        self.__gate_matrix = matrix
+        self.__gate_matrix = _cast(numpy.asarray(matrix))
+
+    def _set_matrix_unchecked(self, matrix):
+        """Method to set a matrix which is known to be unitary without checking it. It's used by 
+        the parametric subclasses to assign their shared matrices.
+
+        Arguments:
+            matrix {numpy.ndarray} -- The new unitary matrix
+        """
+
+        self.__gate_matrix = _cast(matrix)
     
+    @check_gate.set_target_qubits_check
+    def set_target_qubits(self, target_qubits):
+        """Method to set the indices of the qubits of a register which the gate acts on. The 
+        number of the indices must be equal to the number of qubits that the gate acts on. Using 
+        them the gate can be called on a bigger register without building the Kronecker product 
+        of the gate with identity matrices. If the parameter is None, then the gate acts on the 
+        whole register again.
+        
+        Arguments:
+            target_qubits {list, None} -- List of distinct indices of qubits
+        
+        Raises:
+            ValueError, TypeError
+        
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> q1 = qvantum.Qubit(1, 0)
+            >>> q2 = qvantum.Qubit(1, 0)
+            >>> q3 = qvantum.Qubit(1, 0)
+            >>>
+            >>> r = qvantum.Register([q1, q2, q3])
+            >>> h = qvantum.Hadamard()
+            >>> h.set_target_qubits([1])
+            >>> h(r)
+            >>> r.show()
+            '|Ψ> = (0.7071+0.0000i)|000> + (0.0000+0.0000i)|001> + (0.7071+0.0000i)|010> + (0.0000+0.0000i)|011> + (0.0000+0.0000i)|100> + (0.0000+0.0000i)|101> + (0.0000+0.0000i)|110> + (0.0000+0.0000i)|111>'
+        """
+
+        self.__target_qubits = None if target_qubits is None else list(target_qubits)
+
     @check_gate.power_check
     def power(self, power):
         """Method to raise the unitary matrix of the gate to the given power and overwrites the 
@@ -206,27 +734,134 @@ class Gate(object):
             >>>
             >>> t = qvantum.Toffoli()
             >>> t.get_matrix()
-            matrix([[1, 0, 0, 0, 0, 0, 0, 0],
-                    [0, 1, 0, 0, 0, 0, 0, 0],
-                    [0, 0, 1, 0, 0, 0, 0, 0],
-                    [0, 0, 0, 0, 0, 0, 0, 1],
-                    [0, 0, 0, 0, 1, 0, 0, 0],
-                    [0, 0, 0, 0, 0, 1, 0, 0],
-                    [0, 0, 0, 0, 0, 0, 1, 0],
-                    [0, 0, 0, 1, 0, 0, 0, 0]])
+            array([[1.+0.j, 0.+0.j, 0.+0.j, 0.+0.j, 0.+0.j, 0.+0.j, 0.+0.j, 0.+0.j],
+                   [0.+0.j, 1.+0.j, 0.+0.j, 0.+0.j, 0.+0.j, 0.+0.j, 0.+0.j, 0.+0.j],
+                   [0.+0.j, 0.+0.j, 1.+0.j, 0.+0.j, 0.+0.j, 0.+0.j, 0.+0.j, 0.+0.j],
+                   [0.+0.j, 0.+0.j, 0.+0.j, 0.+0.j, 0.+0.j, 0.+0.j, 0.+0.j, 1.+0.j],
+                   [0.+0.j, 0.+0.j, 0.+0.j, 0.+0.j, 1.+0.j, 0.+0.j, 0.+0.j, 0.+0.j],
+                   [0.+0.j, 0.+0.j, 0.+0.j, 0.+0.j, 0.+0.j, 1.+0.j, 0.+0.j, 0.+0.j],
+                   [0.+0.j, 0.+0.j, 0.+0.j, 0.+0.j, 0.+0.j, 0.+0.j, 1.+0.j, 0.+0.j],
+                   [0.+0.j, 0.+0.j, 0.+0.j, 1.+0.j, 0.+0.j, 0.+0.j, 0.+0.j, 0.+0.j]])
             >>> t.power(2)
             >>> t.get_matrix()
-            matrix([[1, 0, 0, 0, 0, 0, 0, 0],
-                    [0, 1, 0, 0, 0, 0, 0, 0],
-                    [0, 0, 1, 0, 0, 0, 0, 0],
-                    [0, 0, 0, 1, 0, 0, 0, 0],
-                    [0, 0, 0, 0, 1, 0, 0, 0],
-                    [0, 0, 0, 0, 0, 1, 0, 0],
-                    [0, 0, 0, 0, 0, 0, 1, 0],
-                    [0, 0, 0, 0, 0, 0, 0, 1]])
+            array([[1.+0.j, 0.+0.j, 0.+0.j, 0.+0.j, 0.+0.j, 0.+0.j, 0.+0.j, 0.+0.j],
+                   [0.+0.j, 1.+0.j, 0.+0.j, 0.+0.j, 0.+0.j, 0.+0.j, 0.+0.j, 0.+0.j],
+                   [0.+0.j, 0.+0.j, 1.+0.j, 0.+0.j, 0.+0.j, 0.+0.j, 0.+0.j, 0.+0.j],
+                   [0.+0.j, 0.+0.j, 0.+0.j, 1.+0.j, 0.+0.j, 0.+0.j, 0.+0.j, 0.+0.j],
+                   [0.+0.j, 0.+0.j, 0.+0.j, 0.+0.j, 1.+0.j, 0.+0.j, 0.+0.j, 0.+0.j],
+                   [0.+0.j, 0.+0.j, 0.+0.j, 0.+0.j, 0.+0.j, 1.+0.j, 0.+0.j, 0.+0.j],
+                   [0.+0.j, 0.+0.j, 0.+0.j, 0.+0.j, 0.+0.j, 0.+0.j, 1.+0.j, 0.+0.j],
+                   [0.+0.j, 0.+0.j, 0.+0.j, 0.+0.j, 0.+0.j, 0.+0.j, 0.+0.j, 1.+0.j]])
+        """
+
+        if power == 0:
+            self.__gate_matrix = _cast(_identity_matrix(self.get_size()))
+
+        else:
+            if power < 0:
+                base = numpy.array(self.__gate_matrix.conjugate().transpose())
+
+            else:
+                base = numpy.array(self.__gate_matrix)
+
+            exponent = abs(power)
+            result = numpy.identity(self.get_size(), dtype=self.__gate_matrix.dtype)
+            buffer = numpy.empty_like(result)
+            while True:
+
+                if exponent & 1:
+                    numpy.matmul(result, base, out=buffer)
+                    result, buffer = buffer, result
+
+                exponent = exponent >> 1
+                if exponent == 0:
+                    break
+
+                numpy.matmul(base, base, out=buffer)
+                base, buffer = buffer, base
+
+            self.__gate_matrix = result
+
+    @check_gate.power_unitary_check
+    def power_unitary(self, power):
+        """Method to raise the unitary matrix of the gate to the given real power and overwrites 
+        the original matrix of the gate with the results matrix. The matrix is diagonalized and 
+        its eigenvalues are raised to the power, so fractional powers such as the square root of 
+        a gate can be computed as well.
+        
+        Arguments:
+            power {int, float} -- The power which the gate is raised on
+        
+        Raises:
+            TypeError
+        
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> x = qvantum.PauliX()
+            >>> x.power_unitary(0.5)
+            >>> x.get_matrix()
+            array([[0.5+0.5j, 0.5-0.5j],
+                   [0.5-0.5j, 0.5+0.5j]])
+        """
+
+        eigenvalues, eigenvectors = numpy.linalg.eig(self.__gate_matrix)
+        self.__gate_matrix = (eigenvectors * eigenvalues ** power) @ \
+            numpy.linalg.inv(eigenvectors)
+
+    @check_gate.apply_on_check
+    def apply_on(self, register, target_wires):
+        """Method to apply the gate on the given qubits of a register. The gate matrix is 
+        contracted only with the axes of the target qubits of the state vector, so the 
+        Kronecker product of the gate with identity matrices is never built and the memory 
+        usage stays O(2^n) instead of O(4^n). It should be preferred to calling a gate of the 
+        same size as the register for registers with many qubits.
+        
+        Arguments:
+            register {Register} -- The register which the gate is applied on
+            target_wires {list} -- List of distinct indices of qubits of the register
+        
+        Raises:
+            ValueError, TypeError
+        
+        Examples:
+            >>> import qvantum
+            >>>
+            >>> r = qvantum.Register([qvantum.Qubit(1, 0), qvantum.Qubit(1, 0)])
+            >>> qvantum.PauliX().apply_on(r, [1])
+            >>> r.show()
+            '|Ψ> = (0.0000+0.0000i)|00> + (1.0000+0.0000i)|01> + (0.0000+0.0000i)|10> + (0.0000+0.0000i)|11>'
+        """
+
+        vector = _apply_structured(self.__gate_matrix, register.ket().ravel(), \
+            list(target_wires), register.get_qubit_number())
+        _store_amplitudes(register, vector)
+
+    @check_gate.apply_batched_check
+    def apply_batched(self, states):
+        """Method to apply the gate on a batch of state vectors at once and return the results. 
+        Every row of the argument is the state vector of a register. If target qubits are set, 
+        then the gate acts only on the given qubits of the registers, otherwise the size of the 
+        gate and the size of the state vectors must be equal. The whole batch is computed by one 
+        matmul call instead of calling the gate on the registers one by one.
+        
+        Arguments:
+            states {numpy.ndarray} -- State vectors of shape (batch, 2^n)
+        
+        Raises:
+            ValueError, TypeError
+        
+        Examples:
+            >>> import numpy
+            >>> import qvantum
+            >>>
+            >>> h = qvantum.Hadamard()
+            >>> h.apply_batched(numpy.array([[1, 0], [0, 1]]))
+            array([[ 0.70710678+0.j,  0.70710678+0.j],
+                   [ 0.70710678+0.j, -0.70710678+0.j]])
         """
 
-        self.__gate_matrix = numpy.linalg.matrix_power(self.__gate_matrix, power)
+        return _apply_batched(self.__gate_matrix, states, self.__target_qubits)
 
 class Hadamard(Gate):
     """This class is an inherited class from the Gate class. It’s the implementation of the 
@@ -234,6 +869,8 @@ class Hadamard(Gate):
 
     """
 
+    MATRIX = _HADAMARD_M
+
     def __init__(self):
         """Method to initialize Hadamard gate.
 
@@ -245,15 +882,7 @@ class Hadamard(Gate):
 
         Gate.__init__(self)
         # super().set_name('Hadamard')
-        # super().set_matrix(numpy.matrix([
-        #     [1 / numpy.sqrt(2), 1 / numpy.sqrt(2)],
-        #     [1 / numpy.sqrt(2), -1 / numpy.sqrt(2)]
-        #     ]))
         super(Hadamard, self).set_name('Hadamard')
-        super(Hadamard, self).set_matrix(numpy.matrix([
-            [1 / numpy.sqrt(2), 1 / numpy.sqrt(2)],
-            [1 / numpy.sqrt(2), -1 / numpy.sqrt(2)]
-            ]))
     
     def set_name(self, name):
         """Setter of name of Hadamard gate. Always raises BaseException.
@@ -279,6 +908,8 @@ class SquareNot(Gate):
     
     """
 
+    MATRIX = _SQUARENOT_M
+
     def __init__(self):
         """Method to initialize Square-Not gate.
 
@@ -290,15 +921,7 @@ class SquareNot(Gate):
 
         Gate.__init__(self)
         # super().set_name('Square-Not')
-        # super().set_matrix(numpy.matrix([
-        #     [1 + complex(0, 1), 1 - complex(0, 1)],
-        #     [1 - complex(0, 1), 1 + complex(0, 1)]
-        #     ]))
         super(SquareNot, self).set_name('Square-Not')
-        super(SquareNot, self).set_matrix(numpy.matrix([
-            [1 + complex(0, 1), 1 - complex(0, 1)],
-            [1 - complex(0, 1), 1 + complex(0, 1)]
-            ]))
     
     def set_name(self, name):
         """Setter of name of Square-Not gate. Always raises BaseException.
@@ -324,6 +947,8 @@ class PauliX(Gate):
     
     """
 
+    MATRIX = _PAULIX_M
+
     def __init__(self):
         """Method to initialize Pauli-X gate.
 
@@ -335,15 +960,7 @@ class PauliX(Gate):
 
         Gate.__init__(self)
         # super().set_name('Pauli-X')
-        # super().set_matrix(numpy.matrix([
-        #     [0, 1],
-        #     [1, 0]
-        #     ]))
         super(PauliX, self).set_name('Pauli-X')
-        super(PauliX, self).set_matrix(numpy.matrix([
-            [0, 1],
-            [1, 0]
-            ]))
     
     def set_name(self, name):
         """Setter of name of Pauli-X gate. Always raises BaseException.
@@ -369,6 +986,8 @@ class PauliY(Gate):
     
     """
 
+    MATRIX = _PAULIY_M
+
     def __init__(self):
         """Method to initialize Pauli-Y gate.
 
@@ -380,15 +999,7 @@ class PauliY(Gate):
 
         Gate.__init__(self)
         # super().set_name('Pauli-Y')
-        # super().set_matrix(numpy.matrix([
-        #     [0, complex(0, -1)],
-        #     [complex(0, 1), 0]
-        #     ]))
         super(PauliY, self).set_name('Pauli-Y')
-        super(PauliY, self).set_matrix(numpy.matrix([
-            [0, complex(0, -1)],
-            [complex(0, 1), 0]
-            ]))
     
     def set_name(self, name):
         """Setter of name of Pauli-Y gate. Always raises BaseException.
@@ -414,6 +1025,8 @@ class PauliZ(Gate):
     
     """
 
+    MATRIX = _PAULIZ_M
+
     def __init__(self):
         """Method to initialize Pauli-Z gate.
 
@@ -425,15 +1038,7 @@ class PauliZ(Gate):
 
         Gate.__init__(self)
         # super().set_name('Pauli-Z')
-        # super().set_matrix(numpy.matrix([
-        #     [1, 0],
-        #     [0, -1]
-        #     ]))
         super(PauliZ, self).set_name('Pauli-Z')
-        super(PauliZ, self).set_matrix(numpy.matrix([
-            [1, 0],
-            [0, -1]
-            ]))
     
     def set_name(self, name):
         """Setter of name of Pauli-Z gate. Always raises BaseException.
@@ -459,6 +1064,8 @@ class Phase(Gate):
     
     """
 
+    MATRIX = _PHASE_M
+
     def __init__(self):
         """Method to initialize Phase gate.
 
@@ -470,15 +1077,7 @@ class Phase(Gate):
 
         Gate.__init__(self)
         # super().set_name('Phase')
-        # super().set_matrix(numpy.matrix([
-        #     [1, 0],
-        #     [0, complex(0, 1)]
-        #     ]))
         super(Phase, self).set_name('Phase')
-        super(Phase, self).set_matrix(numpy.matrix([
-            [1, 0],
-            [0, complex(0, 1)]
-            ]))
     
     def set_name(self, name):
         """Setter of name of Phase gate. Always raises BaseException.
@@ -504,6 +1103,8 @@ class Pi8(Gate):
     
     """
 
+    MATRIX = _PI8_M
+
     def __init__(self):
         """Method to initialize Pi/8 gate.
 
@@ -514,16 +1115,8 @@ class Pi8(Gate):
         """
 
         Gate.__init__(self)
-        # super().set_name(unicodedata.lookup('GREEK SMALL LETTER PI') + '/8')
-        # super().set_matrix(numpy.matrix([
-        #     [1, 0],
-        #     [0, complex(numpy.cos(numpy.pi/4), numpy.sin(numpy.pi/4))]
-        #     ]))
-        super(Pi8, self).set_name(unicodedata.lookup('GREEK SMALL LETTER PI') + '/8')
-        super(Pi8, self).set_matrix(numpy.matrix([
-            [1, 0],
-            [0, complex(numpy.cos(numpy.pi/4), numpy.sin(numpy.pi/4))]
-            ]))
+        # super().set_name(_PI8_NAME)
+        super(Pi8, self).set_name(_PI8_NAME)
     
     def set_name(self, name):
         """Setter of name of Pi/8 gate. Always raises BaseException.
@@ -549,6 +1142,8 @@ class Swap(Gate):
     
     """
 
+    MATRIX = _SWAP_M
+
     def __init__(self):
         """Method to initialize Swap gate.
 
@@ -560,19 +1155,7 @@ class Swap(Gate):
 
         Gate.__init__(self)
         # super().set_name('Swap')
-        # super().set_matrix(numpy.matrix([
-        #     [1, 0, 0, 0],
-        #     [0, 0, 1, 0],
-        #     [0, 1, 0, 0],
-        #     [0, 0, 0, 1]
-        #     ]))
         super(Swap, self).set_name('Swap')
-        super(Swap, self).set_matrix(numpy.matrix([
-            [1, 0, 0, 0],
-            [0, 0, 1, 0],
-            [0, 1, 0, 0],
-            [0, 0, 0, 1]
-            ]))
     
     def set_name(self, name):
         """Setter of name of Swap gate. Always raises BaseException.
@@ -598,6 +1181,8 @@ class SquareSwap(Gate):
     
     """
 
+    MATRIX = _SQUARESWAP_M
+
     def __init__(self):
         """Method to initialize Square-Swap gate.
 
@@ -609,19 +1194,7 @@ class SquareSwap(Gate):
 
         Gate.__init__(self)
         # super().set_name('Square-Swap')
-        # super().set_matrix(numpy.matrix([
-        #     [1, 0, 0, 0],
-        #     [0, (1 + complex(0, 1)) / 2, (1 - complex(0, 1)) / 2, 0],
-        #     [0, (1 - complex(0, 1)) / 2, (1 + complex(0, 1)) / 2, 0],
-        #     [0, 0, 0, 1]
-        #     ]))
         super(SquareSwap, self).set_name('Square-Swap')
-        super(SquareSwap, self).set_matrix(numpy.matrix([
-            [1, 0, 0, 0],
-            [0, (1 + complex(0, 1)) / 2, (1 - complex(0, 1)) / 2, 0],
-            [0, (1 - complex(0, 1)) / 2, (1 + complex(0, 1)) / 2, 0],
-            [0, 0, 0, 1]
-            ]))
     
     def set_name(self, name):
         """Setter of name of Square-Swap gate. Always raises BaseException.
@@ -648,6 +1221,18 @@ class CNOT(Gate):
     
     """
 
+    @classmethod
+    def MATRIX_FACTORY(cls, control_qubit, target_qubit):
+        """Method to return the shared read-only matrix of Controlled-Not gate with the given parameters. 
+        The matrices are cached, so they are built only once for every parameter.
+
+        Arguments:
+            control_qubit {int} -- Possible values: 0 or 1
+            target_qubit {int} -- Possible values: 0 or 1
+        """
+
+        return _cnot_matrix(control_qubit, target_qubit)
+
     @check_gate.CNOT_check
     def __init__(self, control_qubit, target_qubit):
         """Method to initialize Controlled-Not gate.
@@ -668,33 +1253,8 @@ class CNOT(Gate):
         Gate.__init__(self)
         # super().set_name('Controlled-Not')
         super(CNOT, self).set_name('Controlled-Not')
-        if control_qubit == 0 and target_qubit == 1:
-            # super().set_matrix(numpy.matrix([
-            # [1, 0, 0, 0],
-            # [0, 1, 0, 0],
-            # [0, 0, 0, 1],
-            # [0, 0, 1, 0]
-            # ]))
-            super(CNOT, self).set_matrix(numpy.matrix([
-            [1, 0, 0, 0],
-            [0, 1, 0, 0],
-            [0, 0, 0, 1],
-            [0, 0, 1, 0]
-            ]))
-
-        else:
-            # super().set_matrix(numpy.matrix([
-            # [1, 0, 0, 0],
-            # [0, 0, 0, 1],
-            # [0, 0, 1, 0],
-            # [0, 1, 0, 0]
-            # ]))
-            super(CNOT, self).set_matrix(numpy.matrix([
-            [1, 0, 0, 0],
-            [0, 0, 0, 1],
-            [0, 0, 1, 0],
-            [0, 1, 0, 0]
-            ]))
+        # super()._set_matrix_unchecked(self.MATRIX_FACTORY(control_qubit, target_qubit))
+        super(CNOT, self)._set_matrix_unchecked(self.MATRIX_FACTORY(control_qubit, target_qubit))
 
     def set_name(self, name):
         """Setter of name of Controlled-Not gate. Always raises BaseException.
@@ -720,6 +1280,8 @@ class ControlledZ(Gate):
     
     """
 
+    MATRIX = _CONTROLLEDZ_M
+
     def __init__(self):
         """Method to initialize Controlled-Z gate.
 
@@ -731,19 +1293,7 @@ class ControlledZ(Gate):
 
         Gate.__init__(self)
         # super().set_name('Controlled-Z')
-        # super().set_matrix(numpy.matrix([
-        #     [1, 0, 0, 0],
-        #     [0, 1, 0, 0],
-        #     [0, 0, 1, 0],
-        #     [0, 0, 0, -1]
-        #     ]))
         super(ControlledZ, self).set_name('Controlled-Z')
-        super(ControlledZ, self).set_matrix(numpy.matrix([
-            [1, 0, 0, 0],
-            [0, 1, 0, 0],
-            [0, 0, 1, 0],
-            [0, 0, 0, -1]
-            ]))
 
     def set_name(self, name):
         """Setter of name of Controlled-Z gate. Always raises BaseException.
@@ -769,6 +1319,8 @@ class ControlledPhase(Gate):
     
     """
 
+    MATRIX = _CONTROLLEDPHASE_M
+
     def __init__(self):
         """Method to initialize Controlled-Phase gate.
 
@@ -780,19 +1332,7 @@ class ControlledPhase(Gate):
 
         Gate.__init__(self)
         # super().set_name('Controlled-Phase')
-        # super().set_matrix(numpy.matrix([
-        #     [1, 0, 0, 0],
-        #     [0, 1, 0, 0],
-        #     [0, 0, 1, 0],
-        #     [0, 0, 0, complex(0, 1)]
-        #     ]))
         super(ControlledPhase, self).set_name('Controlled-Phase')
-        super(ControlledPhase, self).set_matrix(numpy.matrix([
-            [1, 0, 0, 0],
-            [0, 1, 0, 0],
-            [0, 0, 1, 0],
-            [0, 0, 0, complex(0, 1)]
-            ]))
 
     def set_name(self, name):
         """Setter of name of Controlled-Phase gate. Always raises BaseException.
@@ -818,6 +1358,17 @@ class Ising(Gate):
     
     """
 
+    @classmethod
+    def MATRIX_FACTORY(cls, phi):
+        """Method to return the shared read-only matrix of Ising gate with the given parameters. 
+        The matrices are cached, so they are built only once for every parameter.
+
+        Arguments:
+            phi {int, float} -- The used angle
+        """
+
+        return _ising_matrix(round(phi, 12))
+
     @check_gate.Ising_check
     def __init__(self, phi):
         """Method to initialize Ising gate.
@@ -836,19 +1387,9 @@ class Ising(Gate):
 
         Gate.__init__(self)
         # super().set_name('Ising')
-        # super().set_matrix(numpy.matrix([
-        #     [1, 0, 0, complex(0, -1) * complex(numpy.cos(phi), numpy.sin(phi))],
-        #     [0, 1, complex(0, -1), 0],
-        #     [0, complex(0, -1), 1, 0],
-        #     [complex(0, -1) * complex(numpy.cos(-1 * phi), numpy.sin(-1 * phi)), 0, 0, 1]
-        #     ]))
         super(Ising, self).set_name('Ising')
-        super(Ising, self).set_matrix(numpy.matrix([
-            [1, 0, 0, complex(0, -1) * complex(numpy.cos(phi), numpy.sin(phi))],
-            [0, 1, complex(0, -1), 0],
-            [0, complex(0, -1), 1, 0],
-            [complex(0, -1) * complex(numpy.cos(-1 * phi), numpy.sin(-1 * phi)), 0, 0, 1]
-            ]))
+        # super()._set_matrix_unchecked(self.MATRIX_FACTORY(phi))
+        super(Ising, self)._set_matrix_unchecked(self.MATRIX_FACTORY(phi))
 
     def set_name(self, name):
         """Setter of name of Ising gate. Always raises BaseException.
@@ -868,6 +1409,44 @@ class Ising(Gate):
 
         raise BaseException('Can\'t change the matrix of object in Ising class.')
 
+    @check_gate.Ising_apply_batched_check
+    def apply_batched(self, states, phis=None):
+        """Method to apply Ising gates with different angles on a batch of state vectors at once 
+        and return the results. The n-th state vector is transformed by the Ising gate of the n-th 
+        angle, so a parameter sweep is computed by one matmul call. If no angles are given, then 
+        every state vector is transformed by the angle which the gate was initialized with.
+        
+        Arguments:
+            states {numpy.ndarray} -- State vectors of shape (batch, 2^n)
+            phis {list, numpy.ndarray, None} -- The used angles, one for every state vector (default: {None})
+        
+        Raises:
+            ValueError, TypeError
+        
+        Examples:
+            >>> import numpy
+            >>> import qvantum
+            >>>
+            >>> i = qvantum.Ising(0)
+            >>> i.apply_batched(numpy.array([[1, 0, 0, 0], [1, 0, 0, 0]]), [0, numpy.pi / 2])
+            array([[ 0.70710678+0.00000000e+00j,  0.        +0.00000000e+00j,
+                     0.        +0.00000000e+00j,  0.        -7.07106781e-01j],
+                   [ 0.70710678+0.00000000e+00j,  0.        +0.00000000e+00j,
+                     0.        +0.00000000e+00j, -0.70710678-4.32978028e-17j]])
+        """
+
+        if phis is None:
+            return _apply_batched(self.get_matrix(), states, self.get_target_qubits())
+
+        e_phis = numpy.exp(1j * numpy.asarray(phis, dtype=numpy.float64))
+        matrices = numpy.zeros((len(e_phis), 4, 4), dtype=precision.DEFAULT_DTYPE)
+        matrices[:, [0, 1, 2, 3], [0, 1, 2, 3]] = 1
+        matrices[:, [1, 2], [2, 1]] = complex(0, -1)
+        matrices[:, 0, 3] = complex(0, -1) * e_phis
+        matrices[:, 3, 0] = complex(0, -1) * e_phis.conjugate()
+        matrices *= _INV_SQRT2
+        return _apply_batched(matrices, states, self.get_target_qubits())
+
 class Toffoli(Gate):
     """This class is an inherited class from the Gate class. It’s the implementation of the 
     Toffoli gate. It’s called on 3 qubits. The parameters determine which one is the target 
@@ -875,6 +1454,17 @@ class Toffoli(Gate):
     
     """
 
+    @classmethod
+    def MATRIX_FACTORY(cls, target_qubit):
+        """Method to return the shared read-only matrix of Toffoli gate with the given parameters. 
+        The matrices are cached, so they are built only once for every parameter.
+
+        Arguments:
+            target_qubit {int} -- Possible values: 0, 1 or 2
+        """
+
+        return _toffoli_matrix(target_qubit)
+
     @check_gate.Toffoli_check
     def __init__(self, target_qubit):
         """Method to initialize Toffoli gate.
@@ -894,71 +1484,8 @@ class Toffoli(Gate):
         Gate.__init__(self)
         # super().set_name('Toffoli')
         super(Toffoli, self).set_name('Toffoli')
-        if target_qubit == 2:
-            # super().set_matrix(numpy.matrix([
-            #     [1, 0, 0, 0, 0, 0, 0, 0],
-            #     [0, 1, 0, 0, 0, 0, 0, 0],
-            #     [0, 0, 1, 0, 0, 0, 0, 0],
-            #     [0, 0, 0, 1, 0, 0, 0, 0],
-            #     [0, 0, 0, 0, 1, 0, 0, 0],
-            #     [0, 0, 0, 0, 0, 1, 0, 0],
-            #     [0, 0, 0, 0, 0, 0, 0, 1],
-            #     [0, 0, 0, 0, 0, 0, 1, 0]
-            #     ]))
-            super(Toffoli, self).set_matrix(numpy.matrix([
-                [1, 0, 0, 0, 0, 0, 0, 0],
-                [0, 1, 0, 0, 0, 0, 0, 0],
-                [0, 0, 1, 0, 0, 0, 0, 0],
-                [0, 0, 0, 1, 0, 0, 0, 0],
-                [0, 0, 0, 0, 1, 0, 0, 0],
-                [0, 0, 0, 0, 0, 1, 0, 0],
-                [0, 0, 0, 0, 0, 0, 0, 1],
-                [0, 0, 0, 0, 0, 0, 1, 0]
-                ]))
-
-        elif target_qubit == 1:
-            # super().set_matrix(numpy.matrix([
-            #     [1, 0, 0, 0, 0, 0, 0, 0],
-            #     [0, 1, 0, 0, 0, 0, 0, 0],
-            #     [0, 0, 1, 0, 0, 0, 0, 0],
-            #     [0, 0, 0, 1, 0, 0, 0, 0],
-            #     [0, 0, 0, 0, 1, 0, 0, 0],
-            #     [0, 0, 0, 0, 0, 0, 0, 1],
-            #     [0, 0, 0, 0, 0, 0, 1, 0],
-            #     [0, 0, 0, 0, 0, 1, 0, 0]
-            #     ]))
-            super(Toffoli, self).set_matrix(numpy.matrix([
-                [1, 0, 0, 0, 0, 0, 0, 0],
-                [0, 1, 0, 0, 0, 0, 0, 0],
-                [0, 0, 1, 0, 0, 0, 0, 0],
-                [0, 0, 0, 1, 0, 0, 0, 0],
-                [0, 0, 0, 0, 1, 0, 0, 0],
-                [0, 0, 0, 0, 0, 0, 0, 1],
-                [0, 0, 0, 0, 0, 0, 1, 0],
-                [0, 0, 0, 0, 0, 1, 0, 0]
-                ]))
-
-        else:
-            # super().set_matrix(numpy.matrix([
-            #     [1, 0, 0, 0, 0, 0, 0, 0],
-            #     [0, 1, 0, 0, 0, 0, 0, 0],
-            #     [0, 0, 1, 0, 0, 0, 0, 0],
-            #     [0, 0, 0, 0, 0, 0, 0, 1],
-            #     [0, 0, 0, 0, 1, 0, 0, 0],
-            #     [0, 0, 0, 0, 0, 1, 0, 0],
-            #     [0, 0, 0, 0, 0, 0, 1, 0],
-            #     [0, 0, 0, 1, 0, 0, 0, 0]
-            #     ]))
-            super(Toffoli, self).set_matrix(numpy.matrix([
-                [1, 0, 0, 0, 0, 0, 0, 0],
-                [0, 1, 0, 0, 0, 0, 0, 0],
-                [0, 0, 1, 0, 0, 0, 0, 0],
-                [0, 0, 0, 0, 0, 0, 0, 1],
-                [0, 0, 0, 0, 1, 0, 0, 0],
-                [0, 0, 0, 0, 0, 1, 0, 0],
-                [0, 0, 0, 0, 0, 0, 1, 0],
-                [0, 0, 0, 1, 0, 0, 0, 0]
-                ]))
+        # super()._set_matrix_unchecked(self.MATRIX_FACTORY(target_qubit))
+        super(Toffoli, self)._set_matrix_unchecked(self.MATRIX_FACTORY(target_qubit))
 
     def set_name(self, name):
         """Setter of name of Toffoli gate. Always raises BaseException.
@@ -985,6 +1512,17 @@ class Fredkin(Gate):
     
     """
 
+    @classmethod
+    def MATRIX_FACTORY(cls, control_qubit):
+        """Method to return the shared read-only matrix of Fredkin gate with the given parameters. 
+        The matrices are cached, so they are built only once for every parameter.
+
+        Arguments:
+            control_qubit {int} -- Possible values: 0, 1 or 2
+        """
+
+        return _fredkin_matrix(control_qubit)
+
     @check_gate.Fredkin_check
     def __init__(self, control_qubit):
         """Method to initialize Fredkin gate.
@@ -1004,71 +1542,8 @@ class Fredkin(Gate):
         Gate.__init__(self)
         # super().set_name('Fredkin')
         super(Fredkin, self).set_name('Fredkin')
-        if control_qubit == 0:
-            # super().set_matrix(numpy.matrix([
-            #     [1, 0, 0, 0, 0, 0, 0, 0],
-            #     [0, 1, 0, 0, 0, 0, 0, 0],
-            #     [0, 0, 1, 0, 0, 0, 0, 0],
-            #     [0, 0, 0, 1, 0, 0, 0, 0],
-            #     [0, 0, 0, 0, 1, 0, 0, 0],
-            #     [0, 0, 0, 0, 0, 0, 1, 0],
-            #     [0, 0, 0, 0, 0, 1, 0, 0],
-            #     [0, 0, 0, 0, 0, 0, 0, 1]
-            #     ]))
-            super(Fredkin, self).set_matrix(numpy.matrix([
-                [1, 0, 0, 0, 0, 0, 0, 0],
-                [0, 1, 0, 0, 0, 0, 0, 0],
-                [0, 0, 1, 0, 0, 0, 0, 0],
-                [0, 0, 0, 1, 0, 0, 0, 0],
-                [0, 0, 0, 0, 1, 0, 0, 0],
-                [0, 0, 0, 0, 0, 0, 1, 0],
-                [0, 0, 0, 0, 0, 1, 0, 0],
-                [0, 0, 0, 0, 0, 0, 0, 1]
-                ]))
-
-        elif control_qubit == 1:
-            # super().set_matrix(numpy.matrix([
-            #     [1, 0, 0, 0, 0, 0, 0, 0],
-            #     [0, 1, 0, 0, 0, 0, 0, 0],
-            #     [0, 0, 1, 0, 0, 0, 0, 0],
-            #     [0, 0, 0, 0, 0, 0, 1, 0],
-            #     [0, 0, 0, 0, 1, 0, 0, 0],
-            #     [0, 0, 0, 0, 0, 1, 0, 0],
-            #     [0, 0, 0, 1, 0, 0, 0, 0],
-            #     [0, 0, 0, 0, 0, 0, 0, 1]
-            #     ]))
-            super(Fredkin, self).set_matrix(numpy.matrix([
-                [1, 0, 0, 0, 0, 0, 0, 0],
-                [0, 1, 0, 0, 0, 0, 0, 0],
-                [0, 0, 1, 0, 0, 0, 0, 0],
-                [0, 0, 0, 0, 0, 0, 1, 0],
-                [0, 0, 0, 0, 1, 0, 0, 0],
-                [0, 0, 0, 0, 0, 1, 0, 0],
-                [0, 0, 0, 1, 0, 0, 0, 0],
-                [0, 0, 0, 0, 0, 0, 0, 1]
-                ]))
-
-        else:
-            # super().set_matrix(numpy.matrix([
-            #     [1, 0, 0, 0, 0, 0, 0, 0],
-            #     [0, 1, 0, 0, 0, 0, 0, 0],
-            #     [0, 0, 1, 0, 0, 0, 0, 0],
-            #     [0, 0, 0, 0, 0, 1, 0, 0],
-            #     [0, 0, 0, 0, 1, 0, 0, 0],
-            #     [0, 0, 0, 1, 0, 0, 0, 0],
-            #     [0, 0, 0, 0, 0, 0, 1, 0],
-            #     [0, 0, 0, 0, 0, 0, 0, 1]
-            #     ]))
-            super(Fredkin, self).set_matrix(numpy.matrix([
-                [1, 0, 0, 0, 0, 0, 0, 0],
-                [0, 1, 0, 0, 0, 0, 0, 0],
-                [0, 0, 1, 0, 0, 0, 0, 0],
-                [0, 0, 0, 0, 0, 1, 0, 0],
-                [0, 0, 0, 0, 1, 0, 0, 0],
-                [0, 0, 0, 1, 0, 0, 0, 0],
-                [0, 0, 0, 0, 0, 0, 1, 0],
-                [0, 0, 0, 0, 0, 0, 0, 1]
-                ]))
+        # super()._set_matrix_unchecked(self.MATRIX_FACTORY(control_qubit))
+        super(Fredkin, self)._set_matrix_unchecked(self.MATRIX_FACTORY(control_qubit))
 
     def set_name(self, name):
         """Setter of name of Fredkin gate. Always raises BaseException.
@@ -1087,3 +1562,34 @@ class Fredkin(Gate):
         """
 
         raise BaseException('Can\'t change the matrix of object in Fredkin class.')
+
+@contextlib.contextmanager
+def disable_checks():
+    """Context manager to call gates without checking the type of the argument. Inside the 
+    block Gate.__call__ is replaced by the undecorated method, so the validation frame is skipped 
+    on every gate application. It's meant for simulation loops over circuits which have already 
+    been checked. The original method is restored when the block is left. The method is 
+    replaced on the class, so the checks are disabled for every gate in every thread of the 
+    process while the block runs, and the context manager isn't thread-safe. To disable the 
+    checks for the whole process, set the QVANTUM_DISABLE_CHECKS environment variable before 
+    importing qvantum.
+
+    Examples:
+        >>> import qvantum
+        >>>
+        >>> q = qvantum.Qubit(1, 0)
+        >>> h = qvantum.Hadamard()
+        >>> with qvantum.disable_checks():
+        ...     for i in range(1000):
+        ...         h(q)
+        >>> q.show()
+        '|Ψ> = (1.0000+0.0000i)|0> + (0.0000+0.0000i)|1>'
+    """
+
+    checked_call = Gate.__call__
+    Gate.__call__ = getattr(checked_call, '__wrapped__', checked_call)
+    try:
+        yield
+
+    finally:
+        Gate.__call__ = checked_call
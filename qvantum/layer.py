@@ -6,6 +6,7 @@ from . import check_layer
 import collections
 import copy
 import numpy
+from . import precision
 
 class Layer(object):
     """layer class
@@ -51,8 +52,8 @@ class Layer(object):
             OrderedDict([(0, <qvantum.gate.Hadamard at 0x1ae588c2d68>), (1, <qvantum.gate.Gate at 0x1ae56a08a20>)])
             >>> l2 = qvantum.Layer([qvantum.PauliX()])
             >>> l2.get_layer_matrix()
-            matrix([[0., 1.],
-                    [1., 0.]])
+            array([[0.+0.j, 1.+0.j],
+                   [1.+0.j, 0.+0.j]])
         """
 
         ranks = [i for i in range(len(gate_list))]   
@@ -119,17 +120,17 @@ class Layer(object):
             >>>
             >>> l = qvantum.Layer([qvantum.Hadamard(), qvantum.Gate()])
             >>> l.get_layer_matrix()
-            matrix([[ 0.70710678,  0.        ,  0.70710678,  0.        ],
-                    [ 0.        ,  0.70710678,  0.        ,  0.70710678],
-                    [ 0.70710678,  0.        , -0.70710678, -0.        ],
-                    [ 0.        ,  0.70710678, -0.        , -0.70710678]])
+            array([[ 0.70710678+0.j,  0.+0.j        ,  0.70710678+0.j,  0.+0.j        ],
+                   [ 0.+0.j        ,  0.70710678+0.j,  0.+0.j        ,  0.70710678+0.j],
+                   [ 0.70710678+0.j,  0.+0.j        , -0.70710678+0.j, -0.+0.j        ],
+                   [ 0.+0.j        ,  0.70710678+0.j, -0.+0.j        , -0.70710678+0.j]])
         """
 
-        m = numpy.identity(self.__gate_list[0].get_matrix().shape[0])
+        m = numpy.identity(self.__gate_list[0].get_matrix().shape[0], dtype=precision.DEFAULT_DTYPE)
         for i in range(len(self.__gate_list)):
 
             if i == 0:
-                m = m * self.__gate_list[i].get_matrix()
+                m = m @ self.__gate_list[i].get_matrix()
 
             else:
                 m = numpy.kron(m, self.__gate_list[i].get_matrix())
@@ -144,10 +145,10 @@ class Layer(object):
             >>>
             >>> l = qvantum.Layer([qvantum.Hadamard(), qvantum.Gate()])
             >>> l.get_layer_matrix()
-            matrix([[ 0.70710678,  0.        ,  0.70710678,  0.        ],
-                    [ 0.        ,  0.70710678,  0.        ,  0.70710678],
-                    [ 0.70710678,  0.        , -0.70710678, -0.        ],
-                    [ 0.        ,  0.70710678, -0.        , -0.70710678]])
+            array([[ 0.70710678+0.j,  0.+0.j        ,  0.70710678+0.j,  0.+0.j        ],
+                   [ 0.+0.j        ,  0.70710678+0.j,  0.+0.j        ,  0.70710678+0.j],
+                   [ 0.70710678+0.j,  0.+0.j        , -0.70710678+0.j, -0.+0.j        ],
+                   [ 0.+0.j        ,  0.70710678+0.j, -0.+0.j        , -0.70710678+0.j]])
             >>> l.get_matrix_size()
             4
         """
@@ -164,10 +165,10 @@ class Layer(object):
             >>>
             >>> l = qvantum.Layer([qvantum.Hadamard(), qvantum.Gate()])
             >>> l.get_layer_matrix()
-            matrix([[ 0.70710678,  0.        ,  0.70710678,  0.        ],
-                    [ 0.        ,  0.70710678,  0.        ,  0.70710678],
-                    [ 0.70710678,  0.        , -0.70710678, -0.        ],
-                    [ 0.        ,  0.70710678, -0.        , -0.70710678]])
+            array([[ 0.70710678+0.j,  0.+0.j        ,  0.70710678+0.j,  0.+0.j        ],
+                   [ 0.+0.j        ,  0.70710678+0.j,  0.+0.j        ,  0.70710678+0.j],
+                   [ 0.70710678+0.j,  0.+0.j        , -0.70710678+0.j, -0.+0.j        ],
+                   [ 0.+0.j        ,  0.70710678+0.j, -0.+0.j        , -0.70710678+0.j]])
             >>> l.get_matrix_size()
             4
             >>> l.get_layer_size()
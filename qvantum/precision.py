@@ -0,0 +1,52 @@
+'''precision of the simulation
+
+The matrices of the gates and the state vectors which the gates are applied on are computed as 
+complex numbers with double precision by default. Single precision halves the memory of the gate 
+matrices, of the arrays returned by ket() and bra() and of the batches of Gate.apply_batched(), 
+and the matrix products work on half as many bytes, at the cost of accuracy. The registers keep 
+their amplitudes as Python complex numbers in both precisions, so the state vectors applied with 
+single precision are renormalized when they are written back. The tolerances of the unitarity 
+and normalization checks are scaled to the chosen precision.
+'''
+
+# pylint: disable=E1101, W1401
+
+from . import check_precision
+import numpy
+
+_PRECISIONS = {
+    'single': (numpy.complex64, 1e-5, 5),
+    'double': (numpy.complex128, 1e-10, 10)
+    }
+
+DEFAULT_DTYPE = numpy.complex128
+
+TOLERANCE = 1e-10
+
+DECIMALS = 10
+
+@check_precision.set_precision_check
+def set_precision(precision):
+    """This function sets the precision of the matrices of the gates created afterwards and of 
+    the state vectors which the gates are applied on. The tolerance of the unitarity check is 1e-5 with single 
+    and 1e-10 with double precision, the sum of the squared amplitudes is checked up to 5 and 10 
+    decimals respectively. The gates built with signed permutation matrices are exact in both 
+    precisions.
+    
+    Arguments:
+        precision {str} -- Possible values: 'single' or 'double'
+    
+    Raises:
+        ValueError, TypeError
+    
+    Examples:
+        >>> import qvantum
+        >>>
+        >>> qvantum.set_precision('single')
+        >>> qvantum.PauliX().get_matrix()
+        array([[0.+0.j, 1.+0.j],
+               [1.+0.j, 0.+0.j]], dtype=complex64)
+    """
+
+    global DEFAULT_DTYPE, TOLERANCE, DECIMALS
+    DEFAULT_DTYPE, TOLERANCE, DECIMALS = _PRECISIONS[precision]
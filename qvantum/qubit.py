@@ -4,6 +4,7 @@
 
 from . import check_qubit
 import numpy
+from . import precision
 import unicodedata
 
 class Qubit(object):
@@ -109,6 +110,18 @@ class Qubit(object):
         self.__alpha = alpha
         self.__beta = beta
 
+    def _set_amplitudes_unchecked(self, alpha, beta):
+        """Setter method to replace the old coefficients to new ones without checking them. It's 
+        used by gates whose unitary matrices preserve the norm of the qubit anyway.
+        
+        Arguments:
+            alpha {complex} -- Amplitude or probability of being in state 0
+            beta {complex} -- Amplitude or probability of being in state 1
+        """
+
+        self.__alpha = alpha
+        self.__beta = beta
+
     def show(self):
         """Method to show the state function of the qubit object.
 
@@ -164,7 +177,7 @@ class Qubit(object):
                    [-0.39225178-0.46872167j]])
         """
 
-        ket = numpy.array([self.__alpha, self.__beta])
+        ket = numpy.array([self.__alpha, self.__beta], dtype=precision.DEFAULT_DTYPE)
         ket.shape = (2, 1)
         return ket
 
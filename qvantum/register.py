@@ -6,6 +6,7 @@ from . import check_register
 import collections
 import itertools
 import numpy
+from . import precision
 import unicodedata
 
 class Register(object):
@@ -241,6 +242,16 @@ class Register(object):
             raise ValueError('Invalid input! The amplitudes list must be the same size as the ' +\
                 'number of possible states.')
 
+    def _set_amplitudes_unchecked(self, amp_list):
+        """Setter method to replace the coefficients of the possible states without checking 
+        them. It's used by gates whose unitary matrices preserve the norm of the register anyway.
+        
+        Arguments:
+            amp_list {list} -- List of complex objects, one for every possible state
+        """
+
+        self.__state_vector = collections.OrderedDict(zip(self.__state_vector, amp_list))
+
     def show(self):
         """Method to show the state function of the register object.
 
@@ -373,7 +384,7 @@ class Register(object):
                    [0.51934712-0.23166933j]])
         """
 
-        ket = numpy.array(list(self.__state_vector.values()))
+        ket = numpy.array(list(self.__state_vector.values()), dtype=precision.DEFAULT_DTYPE)
         ket.shape = (len(ket), 1)
         return ket
 